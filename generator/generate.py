@@ -24,6 +24,8 @@ class OnMethod(pydantic.BaseModel):
     category: str | None = None
     doc: str | None = None
     pydantic_model: str | None = None
+    batch_model: str | None = None
+    batch_return_type: str | None = None
 
 
 class EmitMethodArg(pydantic.BaseModel):
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import bisect
 import functools
 import logging
 import typing
@@ -23,15 +24,55 @@ if typing.TYPE_CHECKING:
     from pocket_option.contrib.candles import CandleStorage
     from pocket_option.contrib.deals import DealsStorage
     from pocket_option.middleware import Middleware
-    from pocket_option.types import EmitCallback, JsonFunction, JsonValue, SIOEventListener
+    from pocket_option.types import EmitCallback, EventDecoder, JsonFunction, JsonValue, SIOEventListener
 
-__all__ = ("BasePocketOptionClient",)
+__all__ = ("WILDCARD_EVENT", "BasePocketOptionClient")
+
+WILDCARD_EVENT = "*"
+
+type _Model = type[pydantic.BaseModel] | pydantic.TypeAdapter | EventDecoder | None
+type _EventCallback = typing.Callable[
+    [str, _DecodedEvent],
+    typing.Awaitable[JsonValue | pydantic.BaseModel | list[pydantic.BaseModel] | None],
+]
+
+
+class _DecodedEvent:
+    """
+    Event payload decoded once per incoming frame.
+
+    JSON decoding and the middleware chain run once per frame, model
+    validation runs once per model. All handlers of the frame receive
+    the same objects.
+    """
+
+    __slots__ = ("_validated", "data")
+
+    def __init__(self, data: JsonValue | None) -> None:
+        self.data = data
+        self._validated: dict[int, typing.Any] = {}
+
+    def validate(self, model: _Model) -> typing.Any:
+        key = id(model)
+        if key not in self._validated:
+            self._validated[key] = self._validate(model, self.data)
+        return self._validated[key]
+
+    @staticmethod
+    def _validate(model: _Model, data: JsonValue | None) -> typing.Any:
+        if data and isinstance(data, dict) and model and isclass(model) and issubclass(model, pydantic.BaseModel):
+            return model.model_validate(data)
+        if data and model is not None and not isclass(model):
+            return model.validate_python(data)
+        return data
 
 
 class _Handler[T](typing.TypedDict):
     name: str
-    model: type[pydantic.BaseModel] | pydantic.TypeAdapter | None
+    model: _Model
     callback: T
+    handler: SIOEventListener
+    priority: int
 
 
 class BasePocketOptionClient:
@@ -69,6 +110,8 @@ class BasePocketOptionClient:
         ssl_verify: bool = True,
         websocket_extra_options: dict | None = None,
         timestamp_requests: bool = False,
+        concurrent_handlers: bool = False,
+        handler_timeout: float | None = None,
     ) -> None:
         """Initializes the Socket.IO client wrapper with middleware and connection options.
 
@@ -140,6 +183,19 @@ class BasePocketOptionClient:
         :param timestamp_requests:
             Whether to append a timestamp to each request for caching avoidance.
             Defaults to `False`.
+
+        :param concurrent_handlers:
+            If `True`, handlers of the same event run concurrently in a task group,
+            so a slow handler does not delay the others.
+            The result of the event is still taken from the first handler
+            (in priority order) that returned a non-`None` value.
+            Defaults to `False`.
+
+        :param handler_timeout:
+            Maximum time (in seconds) a single handler may run.
+            Handlers exceeding the timeout are cancelled and logged.
+            `None` disables the timeout.
+            Defaults to `None`.
         """
         self.authorization_data = None
         self.middlewares = middlewares or [MakeJsonOnMiddleware(), FixTypesOnMiddleware()]
@@ -161,14 +217,7 @@ class BasePocketOptionClient:
             websocket_extra_options=websocket_extra_options,
             timestamp_requests=timestamp_requests,
         )
-        self.handlers: list[
-            _Handler[
-                typing.Callable[
-                    ...,
-                    typing.Awaitable[JsonValue | pydantic.BaseModel | list[pydantic.BaseModel] | None],
-                ]
-            ]
-        ] = []
+        self.handlers: dict[str, tuple[_Handler[_EventCallback], ...]] = {}
         self.sio.on("connect", handler=self.handle_connect_event)
         self.sio.on("disconnect", handler=self.handle_disconnect_event)
         self.sio.on("*", handler=self.handle_new_event)
@@ -188,6 +237,8 @@ class BasePocketOptionClient:
         self._deals_storage: DealsStorage | None = None
         self._assets_storage: AssetsStorage | None = None
         self.filter_events_log = filter_events_log or ["updateStream"]
+        self.concurrent_handlers = concurrent_handlers
+        self.handler_timeout = handler_timeout
 
     @property
     def candles(self) -> CandleStorage:
@@ -383,39 +434,105 @@ class BasePocketOptionClient:
         self._authorized_event.clear()
         await self._handle_event("disconnect")
 
-    async def _handle_event(self, event_name: str, data: bytes | None = None) -> JsonValue | None:
-        results = []
+    async def dispatch(self, event_name: str, data: JsonValue | pydantic.BaseModel | None = None) -> JsonValue | None:
+        """
+        Deliver locally generated event to registered handlers.
+
+        Handlers are called exactly as for events received from the server.
+        Model instances are passed to handlers as is, without validation.
+
+        Example:
+
+            await client.dispatch("payoutChanged", PayoutChangedEvent(...))
+
+        :param event_name: Event name.
+        :type event_name: str
+
+        :param data: Event payload.
+        :type data: JsonValue | pydantic.BaseModel | None
+
+        :return: First non-None handler result.
+        :rtype: JsonValue | None
+        """
+        return await self._handle_event(event_name, data)
+
+    async def _handle_event(
+        self,
+        event_name: str,
+        data: bytes | JsonValue | pydantic.BaseModel | None = None,
+    ) -> JsonValue | None:
         if event_name not in self.filter_events_log:
             self.logger.debug("New event '%s' with data %r", event_name, data)
-        for handler in filter(lambda x: x["name"] == event_name, self.handlers):
-            try:
-                result = await handler["callback"](data)
-                results.append(result)
-            except Exception:
-                self.logger.exception(
-                    "Error on handler %s, %s",
-                    handler["name"],
-                    get_function_full_name(handler["callback"]),
-                )
-            else:
-                if event_name not in self.filter_events_log:
-                    self.logger.debug(
-                        "Handled by '%s' with result %r",
-                        get_function_full_name(handler["callback"]),
-                        result,
-                    )
+        handlers = self.handlers.get(event_name) or self.handlers.get(WILDCARD_EVENT, ())
+        if not handlers:
+            return None
+        try:
+            decoded = await self._decode_event(event_name, data)
+        except Exception:
+            self.logger.exception("Error on decoding event %s", event_name)
+            return None
+
+        if self.concurrent_handlers and len(handlers) > 1:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(self._call_handler(handler, event_name, decoded)) for handler in handlers]
+            results = [task.result() for task in tasks]
+        else:
+            results = [await self._call_handler(handler, event_name, decoded) for handler in handlers]
 
         for result in results:
             if result is not None:
                 return result
 
+    async def _decode_event(
+        self,
+        event_name: str,
+        data: JsonValue | bytes | pydantic.BaseModel | None,
+    ) -> _DecodedEvent:
+        if isinstance(data, bytes):
+            data = self.json.loads(data)
+        for middleware in self.middlewares:
+            data = await middleware.on(event_name, data)  # type: ignore
+        return _DecodedEvent(data)  # type: ignore
+
+    async def _call_handler(
+        self,
+        handler: _Handler[_EventCallback],
+        event_name: str,
+        decoded: _DecodedEvent,
+    ) -> typing.Any:
+        try:
+            async with asyncio.timeout(self.handler_timeout):
+                result = await handler["callback"](event_name, decoded)
+        except TimeoutError:
+            self.logger.error(  # noqa: TRY400
+                "Timeout on handler %s, %s",
+                handler["name"],
+                get_function_full_name(handler["handler"]),
+            )
+        except Exception:
+            self.logger.exception(
+                "Error on handler %s, %s",
+                handler["name"],
+                get_function_full_name(handler["handler"]),
+            )
+        else:
+            if event_name not in self.filter_events_log:
+                self.logger.debug(
+                    "Handled by '%s' with result %r",
+                    get_function_full_name(handler["handler"]),
+                    result,
+                )
+            return result
+        return None
+
     @typing.overload
     def add_on(
         self,
         event: str,
         handler: None = ...,
         *,
-        model: type[pydantic.BaseModel] | pydantic.TypeAdapter | None = ...,
+        model: type[pydantic.BaseModel] | pydantic.TypeAdapter | EventDecoder | None = ...,
+        priority: int = ...,
     ) -> typing.Callable[[SIOEventListener], None]: ...
     @typing.overload
     def add_on(
@@ -423,7 +540,8 @@ class BasePocketOptionClient:
         event: str,
         handler: SIOEventListener,
         *,
-        model: type[pydantic.BaseModel] | pydantic.TypeAdapter | None = ...,
+        model: type[pydantic.BaseModel] | pydantic.TypeAdapter | EventDecoder | None = ...,
+        priority: int = ...,
     ) -> None: ...
 
     def add_on(
@@ -431,7 +549,8 @@ class BasePocketOptionClient:
         event: str,
         handler: SIOEventListener | None = None,
         *,
-        model: type[pydantic.BaseModel] | pydantic.TypeAdapter | None = None,
+        model: type[pydantic.BaseModel] | pydantic.TypeAdapter | EventDecoder | None = None,
+        priority: int = 0,
     ) -> None | typing.Callable[[SIOEventListener], None]:
         """
         Register Socket.IO event handler.
@@ -443,28 +562,123 @@ class BasePocketOptionClient:
             - Pydantic model validation;
             - response serialization.
 
+        Handlers are stored in a registry keyed by event name, so dispatch
+        cost does not depend on the number of handlers registered for other
+        events. Handlers of the same event run in descending ``priority``
+        order; handlers with equal priority run in registration order.
+
+        Handlers registered for :data:`WILDCARD_EVENT` (``"*"``) are called
+        only for events without own handlers and receive the event name
+        as the first argument.
+
+        Incoming payload is decoded once per frame: JSON parsing and
+        middlewares run once, and validation runs once per model.
+        All handlers of the event receive the same decoded objects,
+        so handlers must treat them as read-only and copy
+        (e.g. ``model_copy(deep=True)``) before modifying.
+
         :param event: Socket.IO event name.
         :type event: str
 
         :param handler: Event callback.
         :type handler: SIOEventListener | None
 
-        :param model: Optional Pydantic model used for payload validation.
-        :type model: type[pydantic.BaseModel] | pydantic.TypeAdapter | None
+        :param model: Optional Pydantic model used for payload validation,
+            or any decoder implementing ``validate_python``
+            (e.g. :data:`pocket_option.ticks.TICK_BATCH_DECODER`).
+        :type model: type[pydantic.BaseModel] | pydantic.TypeAdapter | EventDecoder | None
+
+        :param priority: Handler priority. Higher values run first.
+        :type priority: int
 
         :return: Decorator when handler is omitted.
         :rtype: typing.Callable | None
         """
 
-        def _get_data(d: JsonValue | bytes | None):
-            if isinstance(d, bytes):
-                d = self.json.loads(d)
-            if d and isinstance(d, dict) and model and isclass(model) and issubclass(model, pydantic.BaseModel):
-                return model.model_validate(d)
-            if d and isinstance(model, pydantic.TypeAdapter):
-                return model.validate_python(d)
-            return d
+        def set_handler(_handler: SIOEventListener):
+            handlers = list(self.handlers.get(event, ()))
+            bisect.insort_right(
+                handlers,
+                self._make_handler(event, _handler, model=model, priority=priority),
+                key=lambda it: -it["priority"],
+            )
+            self.handlers[event] = tuple(handlers)
+
+        if handler:
+            return set_handler(handler)
+        return set_handler
+
+    def remove_on(self, event: str, handler: SIOEventListener | None = None) -> int:
+        """
+        Unregister Socket.IO event handler.
+
+        :param event: Socket.IO event name.
+        :type event: str
+
+        :param handler: Event callback passed to :meth:`add_on`.
+            If omitted, all handlers of the event are removed.
+        :type handler: SIOEventListener | None
 
+        :return: Number of removed handlers.
+        :rtype: int
+        """
+        handlers = self.handlers.get(event, ())
+        left = tuple(it for it in handlers if handler is not None and it["handler"] != handler)
+        if left:
+            self.handlers[event] = left
+        else:
+            self.handlers.pop(event, None)
+        return len(handlers) - len(left)
+
+    def replace_on(
+        self,
+        event: str,
+        old_handler: SIOEventListener,
+        new_handler: SIOEventListener,
+        *,
+        model: type[pydantic.BaseModel] | pydantic.TypeAdapter | EventDecoder | None = None,
+    ) -> bool:
+        """
+        Replace registered Socket.IO event handler in place.
+
+        The new handler keeps position and priority of the replaced one.
+
+        :param event: Socket.IO event name.
+        :type event: str
+
+        :param old_handler: Registered event callback.
+        :type old_handler: SIOEventListener
+
+        :param new_handler: New event callback.
+        :type new_handler: SIOEventListener
+
+        :param model: Optional Pydantic model. Defaults to model of the replaced handler.
+        :type model: type[pydantic.BaseModel] | pydantic.TypeAdapter | EventDecoder | None
+
+        :return: `True` if handler was found and replaced.
+        :rtype: bool
+        """
+        handlers = list(self.handlers.get(event, ()))
+        for i, it in enumerate(handlers):
+            if it["handler"] == old_handler:
+                handlers[i] = self._make_handler(
+                    event,
+                    new_handler,
+                    model=model or it["model"],
+                    priority=it["priority"],
+                )
+                self.handlers[event] = tuple(handlers)
+                return True
+        return False
+
+    def _make_handler(
+        self,
+        event: str,
+        handler: SIOEventListener,
+        *,
+        model: _Model,
+        priority: int,
+    ) -> _Handler[_EventCallback]:
         def _get_result(result: typing.Any):
             if isinstance(result, pydantic.BaseModel):
                 return result.model_dump(mode="json")
@@ -474,24 +688,18 @@ class BasePocketOptionClient:
                 return {k: _get_result(it) for k, it in result.items()}
             return result
 
-        def set_handler(_handler: SIOEventListener):
-            @functools.wraps(_handler)
-            async def wrapper(data: JsonValue | bytes | None):
-                if isinstance(data, bytes):
-                    data = self.json.loads(data)
-                for middleware in self.middlewares:
-                    data = await middleware.on(event, data)
-                new_data = _get_data(data)
-                result = _handler(new_data) if new_data is not None else _handler()
-                if asyncio.iscoroutine(result):
-                    result = await result
-                return _get_result(result)
-
-            self.handlers.append({"name": event, "callback": wrapper, "model": model})  # type: ignore
+        @functools.wraps(handler)
+        async def wrapper(event_name: str, decoded: _DecodedEvent):
+            new_data = decoded.validate(model)
+            args = (new_data,) if new_data is not None else ()
+            if event == WILDCARD_EVENT:
+                args = (event_name, *args)
+            result = handler(*args)
+            if asyncio.iscoroutine(result):
+                result = await result
+            return _get_result(result)
 
-        if handler:
-            return set_handler(handler)
-        return set_handler
+        return {"name": event, "callback": wrapper, "model": model, "handler": handler, "priority": priority}
 
     async def send(
         self,
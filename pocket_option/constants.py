@@ -13,6 +13,7 @@ __all__ = (
     "DEFAULT_USER_AGENT",
     "MAX_INT_32",
     "TIMESTAMP_OFFSET",
+    "UPDATE_ITEMS_NAMES",
     "Regions",
 )
 
@@ -28,6 +29,28 @@ TIMESTAMP_OFFSET = -7200
 DEFAULT_ORIGIN = "https://m.pocketoption.com"
 DEFAULT_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:143.0) Gecko/20100101 Firefox/143.0"
 
+UPDATE_ITEMS_NAMES = (
+    "id",
+    "asset",
+    "label",
+    "type",
+    "digits",
+    "payout",
+    "default_expiration",
+    "min_expiration",
+    "expiration_step",
+    "is_otc",
+    "otc_id",
+    "real_id",
+    "signals",
+    "exp_time",
+    "active",
+    "timeframes",
+    "scheduled_until",
+    "min_quick_timeframe",
+    "scheduled_at",
+)
+
 
 class Regions(enum.StrEnum):
     UNITED_STATES_NORTH = "wss://api-us-north.po.market"
@@ -1,34 +1,114 @@
 from __future__ import annotations
 
 import abc
+import bisect
+import itertools
+import operator
 import os
 import pathlib
 import typing
 import warnings
+from collections import defaultdict
 
 import pydantic
 
 from pocket_option.generated_client import PocketOptionClient
-from pocket_option.models import Asset, UpdateAssetItem
+from pocket_option.models import (
+    ActivityChangedEvent,
+    Asset,
+    PayoutChangedEvent,
+    UpdateAssetItem,
+    UpdateAssetItemListTypeAdapter,
+)
+from pocket_option.utils import SnapshotWriter
 
 if typing.TYPE_CHECKING:
+    import collections.abc
+
     from pocket_option.generated_client import PocketOptionClient
     from pocket_option.models import Asset
+    from pocket_option.types import JsonValue
     from pocket_option.utils import Q
 
-__all__ = ("AssetsStorage",)
+__all__ = ("AssetsDiffDecoder", "AssetsStorage")
+
+
+class AssetsDiffDecoder:
+    """
+    ``updateAssets`` decoder producing only new and changed assets.
+
+    Every ``updateAssets`` frame carries the full catalogue. The decoder
+    remembers the last raw row of every asset and validates only rows
+    that differ from it, so unchanged assets cost one list comparison.
+
+    The decoder is stateful: use one instance per consumer.
+    Can be passed as ``model`` to
+    :meth:`~pocket_option.client.BasePocketOptionClient.add_on`.
+    """
+
+    __slots__ = ("_rows",)
+
+    def __init__(self) -> None:
+        self._rows: dict[int, JsonValue] = {}
+
+    @staticmethod
+    def _get_id(row: typing.Any) -> typing.Any:
+        return row["id"] if isinstance(row, dict) else row[0]
+
+    def validate_python(self, data: list[JsonValue]) -> list[UpdateAssetItem]:
+        rows = [row for row in data if self._rows.get(self._get_id(row)) != row]
+        items = UpdateAssetItemListTypeAdapter.validate_python(rows)
+        for item, row in zip(items, rows, strict=True):
+            self._rows[item.id] = row
+        return items
 
 
 class AssetsStorage(abc.ABC):
+    """
+    Abstract assets storage.
+
+    ``updateAssets`` frames are decoded with :class:`AssetsDiffDecoder`,
+    so only new and changed assets are validated and passed to
+    :meth:`add_assets_bulk`. After the storage is updated, changes of
+    already known assets are dispatched to the client as local events:
+
+        - ``payoutChanged`` (:class:`~pocket_option.models.PayoutChangedEvent`);
+        - ``activityChanged`` (:class:`~pocket_option.models.ActivityChangedEvent`).
+
+    Example:
+
+        @client.on.payout_changed
+        async def on_payout_changed(event: PayoutChangedEvent) -> None:
+            ...
+    """
+
     def __init__(self, client: PocketOptionClient) -> None:
         self.client = client
+        self.decoder = AssetsDiffDecoder()
 
-        self.client.on.assets_update(self._on_update_assets)
+        self.client.add_on("updateAssets", self._on_update_assets, model=self.decoder)
 
         self.client.assets = self
 
     async def _on_update_assets(self, items: list[UpdateAssetItem]) -> None:
+        if not items:
+            return
+        previous = {item.id: await self.get_asset(asset_id=item.id) for item in items}
         await self.add_assets_bulk(items)
+        for item in items:
+            old = previous[item.id]
+            if old is None:
+                continue
+            if old.payout != item.payout:
+                await self.client.dispatch(
+                    "payoutChanged",
+                    PayoutChangedEvent(id=item.id, asset=item.asset, old_payout=old.payout, payout=item.payout),
+                )
+            if old.active != item.active:
+                await self.client.dispatch(
+                    "activityChanged",
+                    ActivityChangedEvent(id=item.id, asset=item.asset, active=item.active),
+                )
 
     @abc.abstractmethod
     async def get_assets(self) -> list[UpdateAssetItem]: ...
@@ -55,9 +135,67 @@ class AssetsStorage(abc.ABC):
 
 
 class MemoryAssetsStorage(AssetsStorage):
+    """
+    In-memory assets storage.
+
+    Assets are indexed by ``id`` and grouped by ``asset``, ``type``,
+    ``is_otc`` and ``active`` secondary indexes, plus a view ordered by
+    ``payout``. Indexes are updated incrementally on every insert, so
+    :meth:`get_asset` and index lookups do not scan the catalogue.
+
+    :meth:`search_assets` answers top-level ``eq``/``in`` lookups on
+    indexed fields and range lookups on ``payout`` (see ``INDEX_LOOKUPS``)
+    from the indexes and evaluates the rest of the query only for the
+    matching assets. Queries that have to scan the whole catalogue are
+    evaluated in bulk over cached per-field columns
+    (see :meth:`~pocket_option.utils.Q.mask`); the columns are dropped
+    whenever an asset changes.
+
+    Example:
+
+        item = await storage.get_asset(assset=Asset.AUDCAD_otc)
+        if item is not None and item.active and item.payout >= 80:
+            ...
+    """
+
+    INDEXED_FIELDS = ("asset", "type", "is_otc", "active")
+    INDEX_LOOKUPS: typing.ClassVar[dict[str, frozenset[str]]] = {
+        "id": frozenset({"eq", "in"}),
+        **{field: frozenset({"eq", "in"}) for field in INDEXED_FIELDS},
+        "payout": frozenset({"gt", "gte", "lt", "lte", "between"}),
+    }
+
     def __init__(self, client: PocketOptionClient):
         super().__init__(client)
         self._storage: dict[int, UpdateAssetItem] = {}
+        self._order: dict[int, int] = {}
+        self._payouts: list[tuple[int, int]] = []
+        self._indexes: dict[str, defaultdict[typing.Any, set[int]]] = {
+            field: defaultdict(set) for field in self.INDEXED_FIELDS
+        }
+        self._rows: list[UpdateAssetItem] | None = None
+        self._columns: dict[str, list[typing.Any]] = {}
+
+    def _index(self, item: UpdateAssetItem, old: UpdateAssetItem | None) -> None:
+        if old is not None:
+            if old.payout != item.payout:
+                key = (old.payout, old.id)
+                index = bisect.bisect_left(self._payouts, key)
+                if index < len(self._payouts) and self._payouts[index] == key:
+                    del self._payouts[index]
+            for field, index_map in self._indexes.items():
+                value = getattr(old, field)
+                ids = index_map[value]
+                ids.discard(old.id)
+                if not ids:
+                    del index_map[value]
+        else:
+            self._order[item.id] = len(self._order)
+
+        if old is None or old.payout != item.payout:
+            bisect.insort(self._payouts, (item.payout, item.id))
+        for field, index_map in self._indexes.items():
+            index_map[getattr(item, field)].add(item.id)
 
     async def get_assets(self) -> list[UpdateAssetItem]:
         return list(self._storage.values())
@@ -69,20 +207,125 @@ class MemoryAssetsStorage(AssetsStorage):
     async def get_asset(self, *, assset: Asset | None = None, asset_id: int | None = None) -> UpdateAssetItem | None:
         if asset_id is not None:
             return self._storage.get(asset_id)
-        if assset is not None:
-            for item in self._storage.values():
-                if item.asset == assset:
-                    return item
+        if assset is not None and (ids := self._indexes["asset"].get(assset)):
+            return self._storage[min(ids, key=self._order.__getitem__)]
         return None
 
     async def search_assets(self, *, query: Q | None = None) -> list[UpdateAssetItem]:
-        assets = list(self._storage.values())
+        """
+        Query stored assets using Q expressions.
+
+        Example:
+
+            assets = await storage.search_assets(
+                query=Q.field("active", "eq", True) & Q.field("payout", "gte", 80),
+            )
+
+        :param query: Asset filter expression
+        :type query: Q | None
+
+        :return: List of assets in arrival order
+        :rtype: list[UpdateAssetItem]
+        """
+        if query is None:
+            return list(self._get_rows())
+        plan = query.plan(self.INDEX_LOOKUPS)
+        ids = self._lookup(plan.lookups)
+        if ids is not None:
+            assets = [self._storage[asset_id] for asset_id in sorted(ids, key=self._order.__getitem__)]
+            return assets if plan.residual is None else [it for it in assets if plan.residual(it)]
+        names = query.field_names()
+        if names is None:
+            return [it for it in self._get_rows() if query(it)]
+        mask = query.mask({name: self._get_column(name) for name in sorted(names)})
+        return list(itertools.compress(self._get_rows(), mask))
+
+    async def get_assets_by_payout(
+        self,
+        *,
+        min_payout: int | None = None,
+        query: Q | None = None,
+        count: int | None = None,
+    ) -> list[UpdateAssetItem]:
+        """
+        Get assets ordered by payout, highest first.
+
+        Assets are read from the payout ordered view, ``query`` is applied
+        to assets paying at least ``min_payout`` only.
+
+        Example:
+
+            best = await storage.get_assets_by_payout(
+                min_payout=80,
+                query=Q.field("active", "eq", True),
+                count=5,
+            )
+
+        :param min_payout: Minimum payout percentage
+        :type min_payout: int | None
+
+        :param query: Additional asset filter expression
+        :type query: Q | None
+
+        :param count: Maximum number of returned assets
+        :type count: int | None
+
+        :return: List of assets ordered by payout descending
+        :rtype: list[UpdateAssetItem]
+        """
+        start = 0 if min_payout is None else bisect.bisect_left(self._payouts, (min_payout,))
+        data = (self._storage[asset_id] for _, asset_id in reversed(self._payouts[start:]))
         if query is not None:
-            assets = [it for it in assets if query(it)]
-        return assets
+            data = filter(query, data)
+        if count:
+            data = itertools.islice(data, count)
+        return list(data)
+
+    def _lookup(self, lookups: collections.abc.Iterable[tuple[str, str, typing.Any]]) -> set[int] | None:
+        ids: set[int] | None = None
+        for field, op, value in lookups:
+            if field == "payout":
+                found = self._lookup_range(op, value)
+            elif op == "in":
+                found = set().union(*(self._lookup_eq(field, it) for it in value))
+            else:
+                found = self._lookup_eq(field, value)
+            ids = found if ids is None else ids & found
+        return ids
+
+    def _lookup_eq(self, field: str, value: typing.Any) -> set[int]:
+        if field == "id":
+            return {value} if value in self._storage else set()
+        return self._indexes[field].get(value, set())
+
+    def _lookup_range(self, op: str, value: typing.Any) -> set[int]:
+        start, stop = 0, len(self._payouts)
+        low, high = value if op == "between" else (value, value)
+        if op in {"gt", "gte", "between"}:
+            bisector = bisect.bisect_right if op == "gt" else bisect.bisect_left
+            start = bisector(self._payouts, low, key=operator.itemgetter(0))
+        if op in {"lt", "lte", "between"}:
+            bisector = bisect.bisect_left if op == "lt" else bisect.bisect_right
+            stop = bisector(self._payouts, high, key=operator.itemgetter(0))
+        return {asset_id for _, asset_id in self._payouts[start:stop]}
+
+    def _get_rows(self) -> list[UpdateAssetItem]:
+        if self._rows is None:
+            self._rows = list(self._storage.values())
+        return self._rows
+
+    def _get_column(self, name: str) -> list[typing.Any]:
+        column = self._columns.get(name)
+        if column is None:
+            column = self._columns[name] = [getattr(it, name) for it in self._get_rows()]
+        return column
 
     async def add_asset(self, item: UpdateAssetItem) -> None:
+        old = self._storage.get(item.id)
         self._storage[item.id] = item
+        self._index(item, old)
+        self._rows = None
+        self._columns.clear()
 
     async def add_assets_bulk(self, items: list[UpdateAssetItem]) -> None:
         for it in items:
@@ -90,11 +333,25 @@ class MemoryAssetsStorage(AssetsStorage):
 
 
 class JSONAssetsStorage(MemoryAssetsStorage):
+    """
+    Development assets storage persisted to ``reverse/assets.json``.
+
+    Changes are persisted by a :class:`~pocket_option.utils.SnapshotWriter`
+    at most once per ``save_delay`` seconds and on disconnect.
+    """
+
     TYPE_ADAPTER = pydantic.TypeAdapter(dict[int, UpdateAssetItem])
 
-    def __init__(self, client: PocketOptionClient):
+    def __init__(self, client: PocketOptionClient, *, save_delay: float = 1.0):
         super().__init__(client)
         self.path = pathlib.Path("reverse", "assets.json")
+        self._snapshot = SnapshotWriter(
+            self.path,
+            snapshot=lambda: dict(self._storage),
+            serialize=self.TYPE_ADAPTER.dump_json,
+            delay=save_delay,
+        )
+        self.client.on.disconnect(self._snapshot.flush)
         if os.environ.get("PO_DEBUG") != "1":
             warnings.warn(
                 "JSONAssetsStorage is intended for development/testing only. Do not use it in production.",
@@ -103,9 +360,13 @@ class JSONAssetsStorage(MemoryAssetsStorage):
             )
 
     def save(self):
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-        self.path.write_bytes(self.TYPE_ADAPTER.dump_json(self._storage, indent=2))
+        """Write the storage to disk immediately."""
+        self._snapshot.write()
+
+    async def flush(self) -> None:
+        """Write pending changes to disk without blocking the event loop."""
+        await self._snapshot.flush()
 
     async def add_asset(self, item: UpdateAssetItem):
         await super().add_asset(item)
-        self.save()
+        self._snapshot.mark_dirty()
@@ -1,28 +1,61 @@
 from __future__ import annotations
 
 import abc
-import collections.abc
+import asyncio
+import bisect
 import contextlib
 import datetime
 import math
+import mmap
 import os
 import pathlib
+import sqlite3
+import struct
+import sys
 import typing
 import warnings
-from collections import defaultdict, deque
-from itertools import chain
+from array import array
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import chain, compress, pairwise, repeat
 
 import pydantic
 import pytz
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 from pocket_option.generated_client import PocketOptionClient
 from pocket_option.models import Asset, LoadHistoryPeriodFastResponse, UpdateCloseValueItem
-from pocket_option.utils import append_or_replace
+from pocket_option.utils import SnapshotWriter, get_function_full_name
 
 if typing.TYPE_CHECKING:
-    from pocket_option.generated_client import PocketOptionClient
+    import collections.abc
+    import io
 
-__all__ = ("Candle", "CandleStorage", "MemoryCandleStorage")
+    from pocket_option.generated_client import PocketOptionClient
+    from pocket_option.ticks import TickBatch
+    from pocket_option.types import TypedEventListener
+    from pocket_option.utils import Q
+
+__all__ = (
+    "Candle",
+    "CandleBatch",
+    "CandleJournal",
+    "CandleSeries",
+    "CandleStorage",
+    "JournalCandleStorage",
+    "LiveCandleBuilder",
+    "MemoryCandleStorage",
+    "SQLiteCandleStorage",
+    "TickBuffer",
+    "TickJournal",
+    "aggregate_candles",
+    "resample_candles",
+)
 
 
 class Candle(pydantic.BaseModel):
@@ -33,6 +66,361 @@ class Candle(pydantic.BaseModel):
     low: float
     high: float
     close: float
+    volume: float | None = None
+
+
+@dataclass(slots=True)
+class CandleBatch:
+    """
+    Columnar OHLCV candles.
+
+    Stores candles of a single asset and timeframe as parallel columns
+    ordered by timestamp. Columns are ``numpy.ndarray`` when NumPy is
+    installed and ``array("d")`` otherwise.
+
+    :class:`Candle` models are created only on request.
+
+    Example:
+
+        batch = await storage.get_candle_batch(Asset.AUDCAD_otc, timeframe=60)
+        last_close = batch.close[-1]
+        candles = batch.to_candles()
+    """
+
+    asset: Asset
+    timeframe: int
+    timestamps: collections.abc.Sequence[float]
+    open: collections.abc.Sequence[float]
+    high: collections.abc.Sequence[float]
+    low: collections.abc.Sequence[float]
+    close: collections.abc.Sequence[float]
+    volume: collections.abc.Sequence[float]
+
+    @classmethod
+    def empty(cls, asset: Asset, timeframe: int) -> CandleBatch:
+        """
+        Create empty batch with ``array("d")`` columns.
+
+        :param asset: Asset of the candles.
+        :type asset: Asset
+
+        :param timeframe: Candle size in seconds.
+        :type timeframe: int
+
+        :return: Empty candle batch.
+        :rtype: CandleBatch
+        """
+        return cls(asset, timeframe, array("d"), array("d"), array("d"), array("d"), array("d"), array("d"))
+
+    @classmethod
+    def from_history(cls, data: LoadHistoryPeriodFastResponse) -> CandleBatch:
+        """
+        Create batch from historical candles.
+
+        :param data: History response.
+        :type data: LoadHistoryPeriodFastResponse
+
+        :return: Candles ordered by timestamp.
+        :rtype: CandleBatch
+        """
+        batch = cls.empty(data.asset, data.period)
+        for it in sorted(data.data, key=lambda it: it.time):
+            batch.append(it.time, it.open, it.high, it.low, it.close, it.volume)
+        return batch
+
+    def append(  # noqa: PLR0917
+        self,
+        timestamp: float,
+        open_: float,
+        high: float,
+        low: float,
+        close: float,
+        volume: float = 0,
+    ) -> None:
+        """
+        Append candle to ``array("d")`` columns.
+
+        Candles must be appended in timestamp order.
+        """
+        self.timestamps.append(timestamp)  # type: ignore
+        self.open.append(open_)  # type: ignore
+        self.high.append(high)  # type: ignore
+        self.low.append(low)  # type: ignore
+        self.close.append(close)  # type: ignore
+        self.volume.append(volume)  # type: ignore
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def __getitem__(self, index: int) -> Candle:
+        return self._make_candle(
+            float(self.timestamps[index]),
+            float(self.open[index]),
+            float(self.high[index]),
+            float(self.low[index]),
+            float(self.close[index]),
+            float(self.volume[index]),
+        )
+
+    def tail(self, count: int) -> CandleBatch:
+        """
+        Get the latest candles.
+
+        :param count: Number of latest candles.
+        :type count: int
+
+        :return: Candle batch with at most ``count`` candles.
+        :rtype: CandleBatch
+        """
+        start = max(len(self) - count, 0)
+        return CandleBatch(
+            asset=self.asset,
+            timeframe=self.timeframe,
+            timestamps=self.timestamps[start:],
+            open=self.open[start:],
+            high=self.high[start:],
+            low=self.low[start:],
+            close=self.close[start:],
+            volume=self.volume[start:],
+        )
+
+    def select(self, start: float | None = None, end: float | None = None) -> CandleBatch:
+        """
+        Select candles by timestamp range.
+
+        :param start: Minimum candle timestamp (inclusive).
+        :type start: float | None
+
+        :param end: Maximum candle timestamp (inclusive).
+        :type end: float | None
+
+        :return: Candles ordered by timestamp.
+        :rtype: CandleBatch
+        """
+        lo = 0 if start is None else bisect.bisect_left(self.timestamps, start)
+        hi = len(self) if end is None else bisect.bisect_right(self.timestamps, end, lo)
+        return CandleBatch(
+            asset=self.asset,
+            timeframe=self.timeframe,
+            timestamps=self.timestamps[lo:hi],
+            open=self.open[lo:hi],
+            high=self.high[lo:hi],
+            low=self.low[lo:hi],
+            close=self.close[lo:hi],
+            volume=self.volume[lo:hi],
+        )
+
+    def columns(self) -> dict[str, collections.abc.Sequence[float]]:
+        """
+        Get columns keyed by :class:`Candle` field names.
+
+        :return: Column per field name.
+        :rtype: dict[str, collections.abc.Sequence[float]]
+        """
+        return {
+            "timestamp": self.timestamps,
+            "open": self.open,
+            "high": self.high,
+            "low": self.low,
+            "close": self.close,
+            "volume": self.volume,
+        }
+
+    def filter(self, query: Q) -> CandleBatch:
+        """
+        Select candles matching query.
+
+        The query is evaluated over the columns in one pass
+        (see :meth:`~pocket_option.utils.Q.mask`), no models are created.
+        ``timestamp`` lookups accept datetime values.
+
+        Example:
+
+            active = batch.filter(Q.field("timestamp", "gte", since) & Q.field("volume", "gte", 10))
+
+        :param query: Candle filter expression.
+        :type query: Q
+
+        :return: Matching candles ordered by timestamp.
+        :rtype: CandleBatch
+        """
+        mask = query.mask(self.columns())
+        return CandleBatch(self.asset, self.timeframe, *(_compress(it, mask) for it in self.columns().values()))
+
+    def to_candles(self) -> list[Candle]:
+        """
+        Materialize candles as models.
+
+        :return: List of candles ordered by timestamp.
+        :rtype: list[Candle]
+        """
+        return [
+            self._make_candle(*it)
+            for it in zip(
+                self.timestamps.tolist(),  # type: ignore
+                self.open.tolist(),  # type: ignore
+                self.high.tolist(),  # type: ignore
+                self.low.tolist(),  # type: ignore
+                self.close.tolist(),  # type: ignore
+                self.volume.tolist(),  # type: ignore
+                strict=True,
+            )
+        ]
+
+    def _make_candle(  # noqa: PLR0917
+        self,
+        timestamp: float,
+        open_: float,
+        high: float,
+        low: float,
+        close: float,
+        volume: float,
+    ) -> Candle:
+        return Candle.model_construct(
+            asset=self.asset,
+            timestamp=datetime.datetime.fromtimestamp(timestamp, tz=pytz.UTC),
+            timeframe=self.timeframe,
+            open=open_,
+            high=high,
+            low=low,
+            close=close,
+            volume=volume,
+        )
+
+
+def _to_datetime(timestamp: float | None) -> datetime.datetime | None:
+    if timestamp is None:
+        return None
+    return datetime.datetime.fromtimestamp(timestamp, tz=pytz.UTC)
+
+
+def _compress(column: collections.abc.Sequence[float], mask: typing.Any) -> collections.abc.Sequence[float]:
+    if np is not None and isinstance(mask, np.ndarray):
+        return np.asarray(column)[mask]
+    return array("d", compress(column, mask))
+
+
+def aggregate_candles(
+    asset: Asset,
+    timeframe: int,
+    timestamps: collections.abc.Sequence[float],
+    values: collections.abc.Sequence[float],
+) -> CandleBatch:
+    """
+    Aggregate price updates into OHLCV candles.
+
+    Candle volume is the number of price updates in the bucket.
+    Price updates must be ordered by timestamp. With NumPy installed the
+    aggregation is vectorized: bucket boundaries are found in one pass and
+    high/low are computed with ``reduceat``. Otherwise a single pure Python
+    pass over the columns is used.
+
+    :param asset: Asset of the price updates.
+    :type asset: Asset
+
+    :param timeframe: Candle size in seconds.
+    :type timeframe: int
+
+    :param timestamps: Price update timestamps.
+    :type timestamps: collections.abc.Sequence[float]
+
+    :param values: Price update values.
+    :type values: collections.abc.Sequence[float]
+
+    :return: Aggregated candles.
+    :rtype: CandleBatch
+    """
+    if np is not None:
+        ts = np.asarray(timestamps, dtype=np.float64)
+        vals = np.asarray(values, dtype=np.float64)
+        buckets = np.floor(ts / timeframe) * timeframe
+        starts = np.flatnonzero(np.diff(buckets, prepend=np.nan))
+        if not len(starts):
+            return CandleBatch(asset, timeframe, buckets, vals, vals, vals, vals, vals)
+        bounds = np.append(starts, len(vals))
+        return CandleBatch(
+            asset=asset,
+            timeframe=timeframe,
+            timestamps=buckets[starts],
+            open=vals[starts],
+            high=np.maximum.reduceat(vals, starts),
+            low=np.minimum.reduceat(vals, starts),
+            close=vals[bounds[1:] - 1],
+            volume=np.diff(bounds).astype(np.float64),
+        )
+
+    batch = CandleBatch.empty(asset, timeframe)
+    current = None
+    for timestamp, value in zip(timestamps, values, strict=True):
+        ts_bucket = math.floor(timestamp / timeframe) * timeframe
+        if ts_bucket != current:
+            current = ts_bucket
+            batch.append(ts_bucket, value, value, value, value, 1)
+            continue
+        batch.high[-1] = max(batch.high[-1], value)  # type: ignore
+        batch.low[-1] = min(batch.low[-1], value)  # type: ignore
+        batch.close[-1] = value  # type: ignore
+        batch.volume[-1] += 1  # type: ignore
+    return batch
+
+
+def resample_candles(batch: CandleBatch, timeframe: int) -> CandleBatch:
+    """
+    Aggregate candles into candles of a larger timeframe.
+
+    ``timeframe`` should be a multiple of ``batch.timeframe``.
+    For each bucket open is the first open, close is the last close,
+    high/low are the extremes and volume is the sum of volumes.
+
+    :param batch: Candles ordered by timestamp.
+    :type batch: CandleBatch
+
+    :param timeframe: Target candle size in seconds.
+    :type timeframe: int
+
+    :return: Aggregated candles.
+    :rtype: CandleBatch
+    """
+    if timeframe == batch.timeframe:
+        return batch
+    if np is not None:
+        buckets = np.floor(np.asarray(batch.timestamps, dtype=np.float64) / timeframe) * timeframe
+        starts = np.flatnonzero(np.diff(buckets, prepend=np.nan))
+        if not len(starts):
+            return CandleBatch(batch.asset, timeframe, buckets, *(np.empty(0) for _ in range(5)))
+        bounds = np.append(starts, len(buckets))
+        return CandleBatch(
+            asset=batch.asset,
+            timeframe=timeframe,
+            timestamps=buckets[starts],
+            open=np.asarray(batch.open, dtype=np.float64)[starts],
+            high=np.maximum.reduceat(np.asarray(batch.high, dtype=np.float64), starts),
+            low=np.minimum.reduceat(np.asarray(batch.low, dtype=np.float64), starts),
+            close=np.asarray(batch.close, dtype=np.float64)[bounds[1:] - 1],
+            volume=np.add.reduceat(np.asarray(batch.volume, dtype=np.float64), starts),
+        )
+
+    result = CandleBatch.empty(batch.asset, timeframe)
+    current = None
+    for timestamp, open_, high, low, close, volume in zip(
+        batch.timestamps,
+        batch.open,
+        batch.high,
+        batch.low,
+        batch.close,
+        batch.volume,
+        strict=True,
+    ):
+        ts_bucket = math.floor(timestamp / timeframe) * timeframe
+        if ts_bucket != current:
+            current = ts_bucket
+            result.append(ts_bucket, open_, high, low, close, volume)
+            continue
+        result.high[-1] = max(result.high[-1], high)  # type: ignore
+        result.low[-1] = min(result.low[-1], low)  # type: ignore
+        result.close[-1] = close  # type: ignore
+        result.volume[-1] += volume  # type: ignore
+    return result
 
 
 class CandleStorage(abc.ABC):
@@ -48,6 +436,16 @@ class CandleStorage(abc.ABC):
     Raw price updates are represented by UpdateCloseValueItem.
     Candles are generated dynamically using timeframe buckets.
 
+    Generated candles are cached per (asset, timeframe) as rollups.
+    A rollup holds at most ``MAX_ROLLUP_LEN`` latest candles and is
+    built from price updates of that window only. Rollups are updated
+    incrementally by the price stream, higher timeframes are derived from
+    cached lower ones built from the same stored data (price updates or
+    candles of the same period, see :meth:`_get_candle_period`), and at
+    most ``MAX_ROLLUPS`` least recently used rollups are kept. Requests
+    reaching before the cached window are aggregated from the price
+    updates of the requested range.
+
     Example:
 
         candles = await storage.get_candles(
@@ -58,51 +456,333 @@ class CandleStorage(abc.ABC):
 
     """
 
+    MAX_ROLLUPS = 32
+    MAX_ROLLUP_LEN = 10_000
+
     def __init__(self, client: PocketOptionClient) -> None:
         self.client = client
-
-        self.client.on.update_close_value(self._on_update_close_value)
+        self._rollups: OrderedDict[tuple[Asset, int], CandleSeries] = OrderedDict()
+        self._last_timestamps: dict[Asset, float] = {}
+        # price updates received while rollups are being built, per build
+        self._recorders: dict[Asset, list[list[TickBatch]]] = {}
+        # invalidation counters, None counts invalidations of all assets
+        self._invalidations: defaultdict[Asset | None, int] = defaultdict(int)
+
+        self.client.on.update_close_value(self._on_update_stream, batch=True)
         self.client.on.load_history_period_fast(self._on_load_history_period_fast)
 
         self.client.candles = self
 
     async def _on_load_history_period_fast(self, data: LoadHistoryPeriodFastResponse) -> None:
-        await self.add_item_bulk(
-            list(
-                chain.from_iterable(
-                    [
-                        [
-                            UpdateCloseValueItem(asset=data.asset, timestamp=it.time, value=it.open),
-                            UpdateCloseValueItem(
-                                asset=data.asset,
-                                timestamp=it.time + 0.01,
-                                value=it.low,
-                            ),
-                            UpdateCloseValueItem(
-                                asset=data.asset,
-                                timestamp=it.time + 0.02,
-                                value=it.high,
-                            ),
-                            UpdateCloseValueItem(
-                                asset=data.asset,
-                                timestamp=it.time + (data.period - 0.01),
-                                value=it.close,
-                            ),
-                        ]
-                        for it in data.data
-                    ],
-                ),
-            ),
+        await self.add_candles_bulk(CandleBatch.from_history(data))
+
+    async def _on_update_stream(self, batch: TickBatch) -> None:
+        await self.add_ticks(batch)
+        self._update_rollups(batch)
+
+    def _update_rollups(self, batch: TickBatch) -> None:
+        groups = batch.by_asset()
+        for asset, group in groups.items():
+            for recorder in self._recorders.get(asset, ()):
+                recorder.append(group)
+            last = self._last_timestamps.get(asset, -math.inf)
+            if group.timestamps[0] <= last or any(b <= a for a, b in pairwise(group.timestamps)):
+                # out-of-order price updates, rebuild on next request
+                self.invalidate_rollups(asset)
+            self._last_timestamps[asset] = max(last, *group.timestamps)
+
+        for key, rollup in list(self._rollups.items()):
+            group = groups.get(key[0])
+            if group is None:
+                continue
+            for timestamp, value in zip(group.timestamps, group.values, strict=True):
+                if not rollup.update(timestamp, value):
+                    del self._rollups[key]
+                    break
+
+    def invalidate_rollups(self, asset: Asset | None = None) -> None:
+        """
+        Drop cached candle rollups.
+
+        Must be called after price updates or candles of the asset are
+        stored outside the price stream.
+
+        :param asset: Asset to drop rollups for. All rollups are dropped if None.
+        :type asset: Asset | None
+        """
+        self._invalidations[asset] += 1
+        if asset is None:
+            self._rollups.clear()
+            return
+        for key in [key for key in self._rollups if key[0] == asset]:
+            del self._rollups[key]
+
+    async def _get_rollup(self, asset: Asset, timeframe: int) -> CandleSeries:
+        key = (asset, timeframe)
+        rollup = self._rollups.get(key)
+        if rollup is not None:
+            self._rollups.move_to_end(key)
+            return rollup
+
+        # lower rollups built from other stored data cover a different range
+        period = await self._get_candle_period(asset, timeframe)
+        lower = [tf for a, tf in self._rollups if a == asset and tf < timeframe and timeframe % tf == 0]
+        lower = [tf for tf in lower if await self._get_candle_period(asset, tf) == period]
+        source = self._rollups.get((asset, max(lower))) if lower else None
+        if source is not None:
+            start = source.start if source.start == -math.inf else math.ceil(source.start / timeframe) * timeframe
+            rollup = CandleSeries(asset, timeframe, self.MAX_ROLLUP_LEN, start=start)
+            rollup.merge(resample_candles(source.select(start), timeframe))
+            return self._add_rollup(rollup)
+
+        # price updates received during the build are missing from the stored
+        # data the build read, they are recorded and applied afterwards
+        recorder: list[TickBatch] = []
+        self._recorders.setdefault(asset, []).append(recorder)
+        invalidations = (self._invalidations[None], self._invalidations[asset])
+        try:
+            start = await self._get_last_timestamp(asset)
+            if start is not None:
+                start = (math.floor(start / timeframe) - self.MAX_ROLLUP_LEN + 1) * timeframe
+                first = await self._get_first_timestamp(asset)
+                if first is None or first >= start:
+                    # the whole history fits into the window
+                    start = None
+            batch, last_timestamp = await self._build_candles(asset, timeframe, start=start)
+        finally:
+            recorders = self._recorders[asset]
+            recorders[:] = [it for it in recorders if it is not recorder]
+            if not recorders:
+                del self._recorders[asset]
+
+        rollup = CandleSeries(asset, timeframe, self.MAX_ROLLUP_LEN, start=-math.inf if start is None else start)
+        rollup.merge(batch)
+        valid = invalidations == (self._invalidations[None], self._invalidations[asset])
+        for group in recorder:
+            for timestamp, value in zip(group.timestamps, group.values, strict=True):
+                if timestamp > last_timestamp and not rollup.update(timestamp, value):
+                    valid = False
+        self._last_timestamps[asset] = max(self._last_timestamps.get(asset, -math.inf), last_timestamp)
+        # rollup invalidated during the build is served once and not cached
+        return self._add_rollup(rollup) if valid else rollup
+
+    async def _get_candle_period(self, asset: Asset, timeframe: int) -> int | None:  # noqa: ARG002
+        """
+        Get period of stored candles the timeframe is built from.
+
+        Storages keeping complete candles natively must override it
+        together with :meth:`_select_candles` and :meth:`_get_candle_bounds`.
+
+        :return: Candle period or None if built from price updates.
+        :rtype: int | None
+        """
+        return None
+
+    async def _select_candles(
+        self,
+        asset: Asset,
+        period: int,
+        *,
+        start: float | None = None,  # noqa: ARG002
+        end: float | None = None,  # noqa: ARG002
+    ) -> tuple[CandleBatch, float | None]:
+        """
+        Select stored complete candles of the period by timestamp range.
+
+        :return: Candles and timestamp of the newest stored candle of the period.
+        :rtype: tuple[CandleBatch, float | None]
+        """
+        return CandleBatch.empty(asset, period), None
+
+    async def _get_candle_bounds(self, asset: Asset) -> list[tuple[float, float]]:  # noqa: ARG002
+        """
+        Get timestamps of the oldest and newest stored complete candles per period.
+
+        :return: ``(first, last)`` pairs.
+        :rtype: list[tuple[float, float]]
+        """
+        return []
+
+    def _add_rollup(self, rollup: CandleSeries) -> CandleSeries:
+        self._rollups[rollup.candles.asset, rollup.period] = rollup
+        while len(self._rollups) > self.MAX_ROLLUPS:
+            self._rollups.popitem(last=False)
+        return rollup
+
+    async def _build_candles(
+        self,
+        asset: Asset,
+        timeframe: int,
+        *,
+        start: float | None = None,
+        end: float | None = None,
+    ) -> tuple[CandleBatch, float]:
+        """
+        Build candles of the timeframe from stored data in range.
+
+        Used when no cached rollup can be reused. Timeframes with stored
+        complete candles (see :meth:`_get_candle_period`) are built from
+        them, price updates extend the newest stored candle and open newer
+        ones. Other timeframes are aggregated from price updates.
+
+        :param start: Minimum price update timestamp (inclusive), aligned to timeframe.
+        :type start: float | None
+
+        :param end: Maximum price update timestamp (inclusive).
+        :type end: float | None
+
+        :return: Candles and timestamp of the newest price update they include.
+        :rtype: tuple[CandleBatch, float]
+        """
+        period = await self._get_candle_period(asset, timeframe)
+        if period is not None:
+            batch, newest = await self._select_candles(asset, period, start=start, end=end)
+            if newest is not None:
+                return await self._extend_candles(batch, newest, timeframe, start=start, end=end)
+        timestamps, values = await self.get_item_columns(asset, start=_to_datetime(start), end=_to_datetime(end))
+        last_timestamp = timestamps[-1] if timestamps else -math.inf
+        return aggregate_candles(asset, timeframe, timestamps, values), last_timestamp
+
+    async def _extend_candles(
+        self,
+        batch: CandleBatch,
+        newest: float,
+        timeframe: int,
+        *,
+        start: float | None = None,
+        end: float | None = None,
+    ) -> tuple[CandleBatch, float]:
+        asset, period = batch.asset, batch.timeframe
+        series = CandleSeries(asset, period, sys.maxsize)
+        series.merge(batch)
+        timestamps, values = await self.get_item_columns(
+            asset,
+            start=_to_datetime(newest if start is None else max(newest, start)),
+            end=_to_datetime(end),
         )
+        split = bisect.bisect_left(timestamps, newest + period)
+        for timestamp, value in zip(timestamps[:split], values[:split], strict=True):
+            series.update(timestamp, value)
+        series.merge(aggregate_candles(asset, period, timestamps[split:], values[split:]))
+        last_timestamp = timestamps[-1] if timestamps else -math.inf
+        return resample_candles(series.select(start, end), timeframe), last_timestamp
+
+    async def _get_last_timestamp(self, asset: Asset) -> float | None:
+        """
+        Get timestamp of the newest stored data of the asset.
+
+        :return: Timestamp or None if nothing is stored.
+        :rtype: float | None
+        """
+        last = [last for _, last in await self._get_candle_bounds(asset)]
+        timestamps, _ = await self.get_item_columns(asset, count=1)
+        return max((*last, *timestamps[-1:]), default=None)
+
+    async def _get_first_timestamp(self, asset: Asset) -> float | None:
+        """
+        Get timestamp of the oldest stored data of the asset.
+
+        :return: Timestamp or None if nothing is stored.
+        :rtype: float | None
+        """
+        timestamps = [first for first, _ in await self._get_candle_bounds(asset)]
+        if (first := await self.get_first_item(asset)) is not None:
+            timestamps.append(first.timestamp)
+        return min(timestamps, default=None)
+
+    async def _build_candle_range(
+        self,
+        asset: Asset,
+        timeframe: int,
+        start: float | None,
+        end: float | None,
+        count: int | None,
+    ) -> CandleBatch:
+        """
+        Aggregate candles outside the cached rollup window.
+
+        Only price updates of the requested range are read. When only
+        ``count`` is given, the range is widened until enough candles are
+        found or the oldest stored price update is reached.
+        """
+        # the candle starting at ``end`` ends one timeframe later
+        stop = None if end is None else (math.floor(end / timeframe) + 1) * timeframe
+        if start is not None or not count:
+            bucket = None if start is None else math.floor(start / timeframe) * timeframe
+            batch, _ = await self._build_candles(asset, timeframe, start=bucket, end=stop)
+            batch = batch.select(start, end)
+            return batch.tail(count) if count is not None else batch
+
+        anchor = stop if stop is not None else await self._get_last_timestamp(asset)
+        first = await self._get_first_timestamp(asset)
+        if anchor is None or first is None:
+            return CandleBatch.empty(asset, timeframe)
+        span = count
+        while True:
+            bucket = (math.floor(anchor / timeframe) - span) * timeframe
+            batch, _ = await self._build_candles(asset, timeframe, start=bucket, end=stop)
+            batch = batch.select(None, end).tail(count)
+            if len(batch) >= count or bucket <= first:
+                return batch
+            span *= 2
+
+    async def add_ticks(self, batch: TickBatch) -> None:
+        """
+        Store price updates received from the price stream.
+
+        Price updates are grouped by asset and stored with
+        :meth:`add_item_columns`.
+
+        :param batch: Price updates.
+        :type batch: TickBatch
+        """
+        for asset, group in batch.by_asset().items():
+            await self.add_item_columns(asset, group.timestamps, group.values)
+
+    async def add_item_columns(
+        self,
+        asset: Asset,
+        timestamps: collections.abc.Sequence[float],
+        values: collections.abc.Sequence[float],
+    ) -> None:
+        """
+        Store price updates of a single asset given as columns.
+
+        The default implementation materializes models and stores them with
+        :meth:`add_item_bulk`. Columnar storages should override it to
+        store the columns in one pass.
+
+        :param asset: Asset of the price updates.
+        :type asset: Asset
+
+        :param timestamps: Price update timestamps.
+        :type timestamps: collections.abc.Sequence[float]
 
-    async def _on_update_close_value(self, items: list[UpdateCloseValueItem]) -> None:
-        await self.add_item_bulk(items)
+        :param values: Price update values.
+        :type values: collections.abc.Sequence[float]
+        """
+        await self.add_item_bulk(
+            [
+                UpdateCloseValueItem.model_construct(asset=asset, timestamp=timestamp, value=value)
+                for timestamp, value in zip(timestamps, values, strict=True)
+            ],
+        )
 
     async def add_candle(self, candle: Candle) -> None:
         """
         Add complete candle into storage.
 
-        The candle is converted into synthetic price updates:
+        Shortcut for :meth:`add_candles_bulk` with a single candle.
+        """
+        batch = CandleBatch.empty(candle.asset, candle.timeframe)
+        batch.append(candle.timestamp.timestamp(), candle.open, candle.high, candle.low, candle.close)
+        await self.add_candles_bulk(batch)
+
+    async def add_candles_bulk(self, batch: CandleBatch) -> None:
+        """
+        Add complete candles into storage.
+
+        Every candle is converted into synthetic price updates:
 
         - open  -> timestamp + 0.00
         - low   -> timestamp + 0.01
@@ -110,28 +790,26 @@ class CandleStorage(abc.ABC):
         - close -> timestamp + timeframe - 0.01
 
         This allows candle reconstruction through the same aggregation
-        mechanism used for live market data.
+        mechanism used for live market data. The price updates are built
+        as columns and stored with a single :meth:`add_item_columns` call.
+
+        :param batch: Candles ordered by timestamp.
+        :type batch: CandleBatch
         """
-        await self.add_item_bulk(
-            [
-                UpdateCloseValueItem(asset=candle.asset, timestamp=candle.timestamp.timestamp(), value=candle.open),
-                UpdateCloseValueItem(
-                    asset=candle.asset,
-                    timestamp=candle.timestamp.timestamp() + 0.01,
-                    value=candle.low,
-                ),
-                UpdateCloseValueItem(
-                    asset=candle.asset,
-                    timestamp=candle.timestamp.timestamp() + 0.02,
-                    value=candle.high,
-                ),
-                UpdateCloseValueItem(
-                    asset=candle.asset,
-                    timestamp=candle.timestamp.timestamp() + (candle.timeframe - 0.01),
-                    value=candle.close,
-                ),
-            ],
-        )
+        close_offset = batch.timeframe - 0.01
+        timestamps, values = array("d"), array("d")
+        for timestamp, open_, high, low, close in zip(
+            batch.timestamps,
+            batch.open,
+            batch.high,
+            batch.low,
+            batch.close,
+            strict=True,
+        ):
+            timestamps.extend((timestamp, timestamp + 0.01, timestamp + 0.02, timestamp + close_offset))
+            values.extend((open_, low, high, close))
+        await self.add_item_columns(batch.asset, timestamps, values)
+        self.invalidate_rollups(batch.asset)
 
     @abc.abstractmethod
     async def add_item(self, item: UpdateCloseValueItem):
@@ -189,6 +867,31 @@ class CandleStorage(abc.ABC):
         :rtype: UpdateCloseValueItem | None
         """
 
+    async def get_item_columns(
+        self,
+        asset: Asset,
+        *,
+        start: datetime.datetime | None = None,
+        end: datetime.datetime | None = None,
+        count: int | None = None,
+    ) -> tuple[collections.abc.Sequence[float], collections.abc.Sequence[float]]:
+        """
+        Retrieve raw price updates as timestamp and value columns.
+
+        Accepts the same filters as :meth:`get_items`. The default
+        implementation is built on top of :meth:`get_items`; storages
+        with columnar layout should override it to avoid model creation.
+
+        :return: Timestamps and values ordered by timestamp.
+        :rtype: tuple[collections.abc.Sequence[float], collections.abc.Sequence[float]]
+        """
+        items = await self.get_items(asset, start=start, end=end, count=count)
+        timestamps, values = array("d"), array("d")
+        for item in items:
+            timestamps.append(item.timestamp)
+            values.append(item.value)
+        return timestamps, values
+
     async def get_candles(
         self,
         asset: Asset,
@@ -231,41 +934,330 @@ class CandleStorage(abc.ABC):
         :return: Iterable of generated candles.
         :rtype: collections.abc.Iterable[Candle]
         """
-        items = await self.get_items(asset, start=start, end=end, count=count)
+        batch = await self.get_candle_batch(asset, timeframe, start=start, end=end, count=count)
+        return batch.to_candles()
 
-        buckets: dict[int, list[UpdateCloseValueItem]] = defaultdict(list)
-        for item in items:
-            ts_bucket = math.floor(item.timestamp / timeframe) * timeframe
-            buckets[ts_bucket].append(item)
-        candles = []
-
-        for ts_bucket in sorted(buckets):
-            group = buckets[ts_bucket]
-            values = [i.value for i in group]
-            candle = Candle(
-                asset=asset,
-                timestamp=datetime.datetime.fromtimestamp(ts_bucket, tz=pytz.UTC),
-                timeframe=timeframe,
-                open=values[0],
-                close=values[-1],
-                high=max(values),
-                low=min(values),
-            )
-            candles.append(candle)
+    async def get_candle_batch(
+        self,
+        asset: Asset,
+        timeframe: int = 5,
+        *,
+        start: datetime.datetime | None = None,
+        end: datetime.datetime | None = None,
+        count: int | None = None,
+    ) -> CandleBatch:
+        """
+        Build OHLC candles from stored price updates as columns.
+
+        Same as :meth:`get_candles`, but returns a :class:`CandleBatch`
+        without creating :class:`Candle` models. ``start`` and ``end``
+        filter candle timestamps. Candles are served from the cached rollup
+        when it covers the request, otherwise only price updates of the
+        requested range are aggregated.
+
+        :param asset: Asset to build candles for.
+        :type asset: Asset
+
+        :param timeframe: Candle size in seconds.
+        :type timeframe: int
+
+        :param start: Start datetime filter.
+        :type start: datetime.datetime | None
+
+        :param end: End datetime filter.
+        :type end: datetime.datetime | None
+
+        :param count: Number of latest candles.
+        :type count: int | None
+
+        :return: Generated candles.
+        :rtype: CandleBatch
+        """
+        rollup = await self._get_rollup(asset, timeframe)
+        lo = start.timestamp() if start else None
+        hi = end.timestamp() if end else None
+        if (lo is not None and lo >= rollup.start) or (lo is None and rollup.start == -math.inf):
+            batch = rollup.select(lo, hi)
+            return batch.tail(count) if count is not None else batch
+        if lo is None and count is not None:
+            batch = rollup.select(None, hi).tail(count)
+            if len(batch) == count:
+                return batch
+        return await self._build_candle_range(asset, timeframe, lo, hi, count)
+
+
+class TickBuffer:
+    """
+    Bounded columnar buffer of price updates for a single asset.
+
+    Timestamps and values are stored in parallel ``array("d")`` columns,
+    16 bytes per price update. Columns are kept sorted by timestamp:
+    in-order price updates are appended in O(1), out-of-order ones are
+    located with binary search.
+
+    When the buffer exceeds its capacity the oldest price updates are
+    dropped. Dropped items are only skipped by moving the buffer head
+    and are physically removed in chunks, so eviction is amortized O(1).
+    """
+
+    __slots__ = ("_head", "_timestamps", "_values", "capacity")
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self._head = 0
+        self._timestamps = array("d")
+        self._values = array("d")
+
+    def __len__(self) -> int:
+        return len(self._timestamps) - self._head
+
+    def add(self, timestamp: float, value: float) -> None:
+        """
+        Store price update.
+
+        Price update with already stored timestamp replaces the stored value.
+        Price update older than all stored ones is dropped when the buffer is full.
+        """
+        timestamps = self._timestamps
+        if len(timestamps) == self._head or timestamp > timestamps[-1]:
+            timestamps.append(timestamp)
+            self._values.append(value)
+            self.trim()
+            return
+        if timestamp == timestamps[-1]:
+            self._values[-1] = value
+            return
+
+        index = bisect.bisect_left(timestamps, timestamp, self._head)
+        if timestamps[index] == timestamp:
+            self._values[index] = value
+        elif index > self._head or len(self) < self.capacity:
+            timestamps.insert(index, timestamp)
+            self._values.insert(index, value)
+            self.trim()
+
+    def extend(self, timestamps: collections.abc.Sequence[float], values: collections.abc.Sequence[float]) -> None:
+        """
+        Store multiple price updates.
+
+        The run is sorted if needed and merged with the stored price updates
+        in a single pass, starting from the first stored timestamp it
+        overlaps. A run newer than all stored price updates is appended
+        as is. Duplicate timestamps keep the latest value.
+        """
+        if not timestamps:
+            return
+        if any(b < a for a, b in pairwise(timestamps)):
+            order = sorted(range(len(timestamps)), key=timestamps.__getitem__)
+            timestamps = [timestamps[i] for i in order]
+            values = [values[i] for i in order]
+
+        stored_timestamps, stored_values = self._timestamps, self._values
+        lo = bisect.bisect_left(stored_timestamps, timestamps[0], self._head)
+        tail_timestamps, tail_values = stored_timestamps[lo:], stored_values[lo:]
+        del stored_timestamps[lo:]
+        del stored_values[lo:]
+
+        i = 0
+        tail_len = len(tail_timestamps)
+        for timestamp, value in zip(timestamps, values, strict=True):
+            while i < tail_len and tail_timestamps[i] < timestamp:
+                stored_timestamps.append(tail_timestamps[i])
+                stored_values.append(tail_values[i])
+                i += 1
+            if i < tail_len and tail_timestamps[i] == timestamp:
+                i += 1
+            if len(stored_timestamps) > self._head and stored_timestamps[-1] == timestamp:
+                stored_values[-1] = value
+            else:
+                stored_timestamps.append(timestamp)
+                stored_values.append(value)
+        stored_timestamps.extend(tail_timestamps[i:])
+        stored_values.extend(tail_values[i:])
+        self.trim()
+
+    def trim(self) -> None:
+        """Drop the oldest price updates exceeding capacity."""
+        overflow = len(self) - self.capacity
+        if overflow > 0:
+            self._head += overflow
+        if self._head and self._head >= len(self):
+            del self._timestamps[: self._head]
+            del self._values[: self._head]
+            self._head = 0
+
+    def first(self) -> tuple[float, float]:
+        """
+        Get the oldest stored price update.
+
+        :raises IndexError: If the buffer is empty.
+
+        :return: Timestamp and value.
+        :rtype: tuple[float, float]
+        """
+        return self._timestamps[self._head], self._values[self._head]
 
-        return candles
+    def columns(self) -> tuple[array[float], array[float]]:
+        """
+        Copy stored columns.
+
+        :return: Timestamps and values ordered by timestamp.
+        :rtype: tuple[array[float], array[float]]
+        """
+        return self.select()
+
+    def select(
+        self,
+        start: float | None = None,
+        end: float | None = None,
+        count: int | None = None,
+    ) -> tuple[array[float], array[float]]:
+        """
+        Select price updates by timestamp range.
+
+        Range bounds are located with binary search, so the cost depends
+        only on the number of selected price updates.
+
+        :param start: Minimum timestamp (inclusive).
+        :type start: float | None
+
+        :param end: Maximum timestamp (inclusive).
+        :type end: float | None
+
+        :param count: Maximum number of latest price updates.
+        :type count: int | None
+
+        :return: Timestamps and values ordered by timestamp.
+        :rtype: tuple[array[float], array[float]]
+        """
+        timestamps = self._timestamps
+        lo = self._head if start is None else bisect.bisect_left(timestamps, start, self._head)
+        hi = len(timestamps) if end is None else bisect.bisect_right(timestamps, end, lo)
+        if count is not None:
+            lo = max(lo, hi - count)
+        return timestamps[lo:hi], self._values[lo:hi]
+
+
+class CandleSeries:
+    """
+    Bounded columnar OHLCV candles of a single asset and period.
+
+    Candles are kept sorted by timestamp in a :class:`CandleBatch` with
+    ``array("d")`` columns. Complete candles (e.g. history) are merged
+    with :meth:`merge`, live price updates only extend the newest candle
+    or open the next one with :meth:`update`.
+
+    When the series exceeds its capacity the oldest candles are dropped.
+
+    :ivar start: Candles with timestamps not lower than ``start`` are complete.
+    """
+
+    __slots__ = ("candles", "capacity", "start")
+
+    def __init__(self, asset: Asset, period: int, capacity: int, *, start: float = -math.inf) -> None:
+        self.capacity = capacity
+        self.candles = CandleBatch.empty(asset, period)
+        self.start = start
+
+    def __len__(self) -> int:
+        return len(self.candles)
+
+    @property
+    def period(self) -> int:
+        return self.candles.timeframe
+
+    def merge(self, batch: CandleBatch) -> None:
+        """
+        Store complete candles.
+
+        Candles with already stored timestamps replace the stored ones.
+
+        :param batch: Candles of the series period ordered by timestamp.
+        :type batch: CandleBatch
+        """
+        if not len(batch):
+            return
+        candles = self.candles
+        columns = (candles.timestamps, candles.open, candles.high, candles.low, candles.close, candles.volume)
+        lo = bisect.bisect_left(candles.timestamps, batch.timestamps[0])
+        rows = {row[0]: row for row in zip(*(column[lo:] for column in columns), strict=True)}
+        rows.update(
+            (row[0], row)
+            for row in zip(batch.timestamps, batch.open, batch.high, batch.low, batch.close, batch.volume, strict=True)
+        )
+        for column in columns:
+            del column[lo:]  # type: ignore
+        for timestamp in sorted(rows):
+            candles.append(*rows[timestamp])
+        self.trim()
+
+    def update(self, timestamp: float, value: float) -> bool:
+        """
+        Apply price update to the newest candle.
+
+        Price update of a newer bucket opens a new candle. Price updates
+        older than the newest candle are ignored.
+
+        :return: False if the price update was ignored.
+        :rtype: bool
+        """
+        candles = self.candles
+        period = candles.timeframe
+        ts_bucket = math.floor(timestamp / period) * period
+        if not len(candles) or ts_bucket > candles.timestamps[-1]:
+            candles.append(ts_bucket, value, value, value, value, 1)
+            self.trim()
+        elif ts_bucket == candles.timestamps[-1]:
+            candles.high[-1] = max(candles.high[-1], value)  # type: ignore
+            candles.low[-1] = min(candles.low[-1], value)  # type: ignore
+            candles.close[-1] = value  # type: ignore
+            candles.volume[-1] += 1  # type: ignore
+        else:
+            return False
+        return True
+
+    def trim(self) -> None:
+        """Drop the oldest candles exceeding capacity."""
+        overflow = len(self.candles) - self.capacity
+        if overflow > 0:
+            candles = self.candles
+            for column in (candles.timestamps, candles.open, candles.high, candles.low, candles.close, candles.volume):
+                del column[:overflow]  # type: ignore
+            self.start = candles.timestamps[0]
+
+    def select(self, start: float | None = None, end: float | None = None) -> CandleBatch:
+        """
+        Select candles by timestamp range.
+
+        :param start: Minimum candle timestamp (inclusive).
+        :type start: float | None
+
+        :param end: Maximum candle timestamp (inclusive).
+        :type end: float | None
+
+        :return: Candles ordered by timestamp.
+        :rtype: CandleBatch
+        """
+        return self.candles.select(start, end)
 
 
 class MemoryCandleStorage(CandleStorage):
     """
     In-memory candle storage.
 
-    Stores raw price updates in memory using bounded deques.
+    Stores raw price updates in memory using bounded columnar
+    buffers (:class:`TickBuffer`). Complete candles (history) are stored
+    natively per (asset, period) in :class:`CandleSeries`, which live
+    price updates keep up to date.
+
+    Candles with a timeframe that is a multiple of a stored period are
+    served from the candle series; other timeframes are aggregated from
+    raw price updates.
 
     Features:
         - separate storage per asset;
         - automatic replacement of duplicate timestamps;
-        - configurable maximum history size.
+        - configurable maximum history size (price updates and candles).
 
     Data is lost after process restart.
 
@@ -279,35 +1271,137 @@ class MemoryCandleStorage(CandleStorage):
         )
     """
 
-    def __init__(self, client: PocketOptionClient) -> None:
+    def __init__(self, client: PocketOptionClient, *, max_len: int = 10_000) -> None:
         super().__init__(client)
-        self._max_len = 10_000
-        self._storage: dict[Asset, deque[UpdateCloseValueItem]] = defaultdict(lambda: deque(maxlen=10_000))
+        self._max_len = max_len
+        self._storage: dict[Asset, TickBuffer] = {}
+        self._series: dict[Asset, dict[int, CandleSeries]] = {}
 
     def set_max_len(self, _max_len: int):
         """
         Change maximum number of stored price updates per asset.
 
+        Already stored price updates exceeding the new limit are dropped.
 
-        :param max_len: Maximum deque size.
+        :param max_len: Maximum buffer size.
         :type max_len: int
         """
-        self._storage = defaultdict(lambda: deque(maxlen=_max_len))
+        self._max_len = _max_len
+        for buffer in self._storage.values():
+            buffer.capacity = _max_len
+            buffer.trim()
+        for series in chain.from_iterable(it.values() for it in self._series.values()):
+            series.capacity = _max_len
+            series.trim()
+
+    def _get_buffer(self, asset: Asset) -> TickBuffer:
+        buffer = self._storage.get(asset)
+        if buffer is None:
+            buffer = self._storage[asset] = TickBuffer(self._max_len)
+        return buffer
 
     async def get_first_item(self, asset: Asset) -> UpdateCloseValueItem | None:
-        items = self._storage.get(asset, [])
-        if not items:
+        buffer = self._storage.get(asset)
+        if not buffer:
             return None
-        with contextlib.suppress(ValueError):
-            return min(items, key=lambda i: i.timestamp)
-        return None
+        timestamp, value = buffer.first()
+        return UpdateCloseValueItem.model_construct(asset=asset, timestamp=timestamp, value=value)
 
     async def add_item(self, item: UpdateCloseValueItem):
-        self._storage[item.asset] = append_or_replace(self._storage[item.asset], item, ["asset", "timestamp"])
+        self._get_buffer(item.asset).add(item.timestamp, item.value)
+        self.invalidate_rollups(item.asset)
 
     async def add_item_bulk(self, items: list[UpdateCloseValueItem]):
+        columns: dict[Asset, tuple[array[float], array[float]]] = {}
         for it in items:
-            await self.add_item(it)
+            timestamps, values = columns.get(it.asset) or columns.setdefault(it.asset, (array("d"), array("d")))
+            timestamps.append(it.timestamp)
+            values.append(it.value)
+        for asset, (timestamps, values) in columns.items():
+            await self.add_item_columns(asset, timestamps, values)
+            self.invalidate_rollups(asset)
+
+    async def add_item_columns(
+        self,
+        asset: Asset,
+        timestamps: collections.abc.Sequence[float],
+        values: collections.abc.Sequence[float],
+    ) -> None:
+        self._get_buffer(asset).extend(timestamps, values)
+        for series in self._series.get(asset, {}).values():
+            for timestamp, value in zip(timestamps, values, strict=True):
+                series.update(timestamp, value)
+
+    async def add_candles_bulk(self, batch: CandleBatch) -> None:
+        periods = self._series.setdefault(batch.asset, {})
+        series = periods.get(batch.timeframe)
+        if series is None:
+            series = periods[batch.timeframe] = CandleSeries(batch.asset, batch.timeframe, self._max_len)
+        series.merge(batch)
+
+        # price updates received before the candles belong to newer buckets
+        buffer = self._storage.get(batch.asset)
+        if buffer and len(series):
+            timestamps, values = buffer.select(series.candles.timestamps[-1] + series.period)
+            for timestamp, value in zip(timestamps, values, strict=True):
+                series.update(timestamp, value)
+        self.invalidate_rollups(batch.asset)
+
+    def _find_series(self, asset: Asset, timeframe: int) -> CandleSeries | None:
+        periods = [period for period in self._series.get(asset, {}) if timeframe % period == 0]
+        if not periods:
+            return None
+        return self._series[asset][max(periods)]
+
+    async def _get_candle_period(self, asset: Asset, timeframe: int) -> int | None:
+        series = self._find_series(asset, timeframe)
+        return series.period if series is not None and len(series) else None
+
+    async def _build_candles(
+        self,
+        asset: Asset,
+        timeframe: int,
+        *,
+        start: float | None = None,
+        end: float | None = None,
+    ) -> tuple[CandleBatch, float]:
+        series = self._find_series(asset, timeframe)
+        if series is None or not len(series):
+            return await super()._build_candles(asset, timeframe, start=start, end=end)
+        last_timestamp = -math.inf
+        if buffer := self._storage.get(asset):
+            timestamps, _ = buffer.select(end=end, count=1)
+            last_timestamp = timestamps[-1] if timestamps else -math.inf
+        return resample_candles(series.select(start, end), timeframe), last_timestamp
+
+    async def _get_last_timestamp(self, asset: Asset) -> float | None:
+        timestamps = [series.candles.timestamps[-1] for series in self._series.get(asset, {}).values() if len(series)]
+        if buffer := self._storage.get(asset):
+            timestamps.append(buffer.select(count=1)[0][-1])
+        return max(timestamps, default=None)
+
+    async def _get_first_timestamp(self, asset: Asset) -> float | None:
+        timestamps = [series.candles.timestamps[0] for series in self._series.get(asset, {}).values() if len(series)]
+        if buffer := self._storage.get(asset):
+            timestamps.append(buffer.first()[0])
+        return min(timestamps, default=None)
+
+    async def get_item_columns(
+        self,
+        asset: Asset,
+        *,
+        start: datetime.datetime | None = None,
+        end: datetime.datetime | None = None,
+        count: int | None = None,
+    ) -> tuple[array[float], array[float]]:
+        buffer = self._storage.get(asset)
+        if not buffer:
+            return array("d"), array("d")
+        return buffer.select(
+            start.timestamp() if start else None,
+            end.timestamp() if end else None,
+            count,
+        )
 
     async def get_items(
         self,
@@ -317,24 +1411,31 @@ class MemoryCandleStorage(CandleStorage):
         end: datetime.datetime | None = None,
         count: int | None = None,
     ) -> collections.abc.Iterable[UpdateCloseValueItem]:
-        items = self._storage.get(asset, [])
-        if start:
-            items = [i for i in items if i.timestamp >= start.timestamp()]
-        if end:
-            items = [i for i in items if i.timestamp <= end.timestamp()]
-        items = list(items)
-        items.sort(key=lambda i: i.timestamp)
-        if count is not None:
-            items = items[-count:]
-        return items
+        timestamps, values = await self.get_item_columns(asset, start=start, end=end, count=count)
+        return [
+            UpdateCloseValueItem.model_construct(asset=asset, timestamp=timestamp, value=value)
+            for timestamp, value in zip(timestamps, values, strict=True)
+        ]
 
 
 class JSONCandleStorage(MemoryCandleStorage):
-    TYPE_ADAPTER = pydantic.TypeAdapter(dict[Asset, deque[UpdateCloseValueItem]])
+    """
+    Development candle storage persisted to ``reverse/candles.json``.
 
-    def __init__(self, client: PocketOptionClient) -> None:
-        super().__init__(client)
+    Complete candles are stored as synthetic price updates, so the
+    file only contains price updates.
+
+    Changes are persisted by a :class:`~pocket_option.utils.SnapshotWriter`
+    at most once per ``save_delay`` seconds and on disconnect.
+    """
+
+    TYPE_ADAPTER = pydantic.TypeAdapter(dict[Asset, list[UpdateCloseValueItem]])
+
+    def __init__(self, client: PocketOptionClient, *, max_len: int = 10_000, save_delay: float = 1.0) -> None:
+        super().__init__(client, max_len=max_len)
         self.path = pathlib.Path("reverse", "candles.json")
+        self._snapshot = SnapshotWriter(self.path, snapshot=self._take_snapshot, serialize=self._dump, delay=save_delay)
+        self.client.on.disconnect(self._snapshot.flush)
         if os.environ.get("PO_DEBUG") != "1":
             warnings.warn(
                 "JSONCandleStorage is intended for development/testing only. Do not use it in production.",
@@ -342,10 +1443,1014 @@ class JSONCandleStorage(MemoryCandleStorage):
                 stacklevel=2,
             )
 
+    def _take_snapshot(self) -> dict[Asset, tuple[array[float], array[float]]]:
+        return {asset: buffer.columns() for asset, buffer in self._storage.items()}
+
+    def _dump(self, data: dict[Asset, tuple[array[float], array[float]]]) -> bytes:
+        return self.TYPE_ADAPTER.dump_json(
+            {
+                asset: [
+                    UpdateCloseValueItem.model_construct(asset=asset, timestamp=timestamp, value=value)
+                    for timestamp, value in zip(timestamps, values, strict=True)
+                ]
+                for asset, (timestamps, values) in data.items()
+            },
+        )
+
     def save(self):
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-        self.path.write_bytes(self.TYPE_ADAPTER.dump_json(self._storage, indent=2))
+        """Write the storage to disk immediately."""
+        self._snapshot.write()
+
+    async def flush(self) -> None:
+        """Write pending changes to disk without blocking the event loop."""
+        await self._snapshot.flush()
 
     async def add_item(self, item: UpdateCloseValueItem):
         await super().add_item(item)
-        self.save()
+        self._snapshot.mark_dirty()
+
+    async def add_candles_bulk(self, batch: CandleBatch) -> None:
+        await CandleStorage.add_candles_bulk(self, batch)
+
+    async def add_item_columns(
+        self,
+        asset: Asset,
+        timestamps: collections.abc.Sequence[float],
+        values: collections.abc.Sequence[float],
+    ) -> None:
+        await super().add_item_columns(asset, timestamps, values)
+        self._snapshot.mark_dirty()
+
+
+class SQLiteCandleStorage(CandleStorage):
+    """
+    SQLite candle storage.
+
+    Stores raw price updates in an append-only ``ticks`` table keyed by
+    ``(asset, timestamp)``. The database runs in WAL mode, so reads do not
+    block writes.
+
+    Complete candles (history) are stored natively in a ``candles`` table
+    keyed by ``(asset, period, timestamp)``. Candles with a timeframe that
+    is a multiple of a stored period are built from the stored candles,
+    with price updates extending the newest stored candle and opening
+    newer ones; other timeframes are aggregated from raw price updates.
+
+    Price updates are buffered in memory and written in a single
+    transaction when ``flush_size`` updates are pending or
+    ``flush_interval`` seconds have passed since the first pending one.
+    Pending updates are flushed before every read and on disconnect.
+
+    All database calls run in a dedicated worker thread, so the event
+    loop is never blocked by disk I/O.
+
+    Example:
+
+        storage = SQLiteCandleStorage(client, path="candles.sqlite3")
+        ...
+        candles = await storage.get_candles(Asset.AUDCAD_otc, timeframe=60)
+        ...
+        await storage.close()
+    """
+
+    def __init__(
+        self,
+        client: PocketOptionClient,
+        *,
+        path: str | os.PathLike[str] = "candles.sqlite3",
+        flush_size: int = 1_000,
+        flush_interval: float = 1.0,
+    ) -> None:
+        super().__init__(client)
+        self.path = pathlib.Path(path)
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="SQLiteCandleStorage")
+        self._connection: sqlite3.Connection | None = None
+        self._pending: list[tuple[str, float, float]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._flush_task: asyncio.Task[None] | None = None
+        # stored candle periods per asset, loaded on first use
+        self._periods: dict[Asset, set[int]] | None = None
+
+        self.client.on.disconnect(self._on_disconnect)
+
+    async def _on_disconnect(self) -> None:
+        await self.flush()
+
+    async def _run[T](self, func: typing.Callable[..., T], *args: typing.Any) -> T:
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS ticks ("
+                "asset TEXT NOT NULL, "
+                "timestamp REAL NOT NULL, "
+                "value REAL NOT NULL, "
+                "PRIMARY KEY (asset, timestamp)"
+                ") WITHOUT ROWID",
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS candles ("
+                "asset TEXT NOT NULL, "
+                "period INTEGER NOT NULL, "
+                "timestamp REAL NOT NULL, "
+                "open REAL NOT NULL, "
+                "high REAL NOT NULL, "
+                "low REAL NOT NULL, "
+                "close REAL NOT NULL, "
+                "volume REAL NOT NULL, "
+                "PRIMARY KEY (asset, period, timestamp)"
+                ") WITHOUT ROWID",
+            )
+            self._connection = connection
+        return self._connection
+
+    def _write(self, rows: list[tuple[str, float, float]]) -> None:
+        connection = self._connect()
+        with connection:
+            connection.executemany("INSERT OR REPLACE INTO ticks (asset, timestamp, value) VALUES (?, ?, ?)", rows)
+
+    def _write_candles(self, batch: CandleBatch) -> None:
+        connection = self._connect()
+        with connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO candles (asset, period, timestamp, open, high, low, close, volume) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                zip(
+                    repeat(batch.asset.value),
+                    repeat(batch.timeframe),
+                    *(map(float, column) for column in batch.columns().values()),
+                ),
+            )
+
+    def _select(self, query: str, params: tuple[typing.Any, ...]) -> list[tuple[typing.Any, ...]]:
+        return self._connect().execute(query, params).fetchall()
+
+    def _select_periods(self) -> dict[Asset, set[int]]:
+        periods: dict[Asset, set[int]] = {}
+        for asset, period in self._select("SELECT DISTINCT asset, period FROM candles", ()):
+            periods.setdefault(Asset(asset), set()).add(period)
+        return periods
+
+    def _select_candle_bounds(self, asset: Asset, periods: list[int]) -> list[tuple[float, float]]:
+        # separate subqueries, so both are answered by the primary key
+        return [
+            self._select(
+                "SELECT "
+                "(SELECT MIN(timestamp) FROM candles WHERE asset = ?1 AND period = ?2), "
+                "(SELECT MAX(timestamp) FROM candles WHERE asset = ?1 AND period = ?2)",
+                (asset.value, period),
+            )[0]
+            for period in periods
+        ]
+
+    def _read_candles(
+        self,
+        asset: Asset,
+        period: int,
+        start: float | None,
+        end: float | None,
+    ) -> tuple[CandleBatch, float | None]:
+        query = "SELECT timestamp, open, high, low, close, volume FROM candles WHERE asset = ? AND period = ?"
+        params: list[typing.Any] = [asset.value, period]
+        if start is not None:
+            query += " AND timestamp >= ?"
+            params.append(start)
+        if end is not None:
+            query += " AND timestamp <= ?"
+            params.append(end)
+        batch = CandleBatch.empty(asset, period)
+        for row in self._select(query + " ORDER BY timestamp", tuple(params)):
+            batch.append(*row)
+        newest = self._select(
+            "SELECT MAX(timestamp) FROM candles WHERE asset = ? AND period = ?",
+            (asset.value, period),
+        )[0][0]
+        return batch, newest
+
+    def _close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def _schedule_flush(self, delay: float | None = None) -> None:
+        if len(self._pending) >= self.flush_size and delay is None:
+            self._start_flush()
+        elif self._flush_handle is None:
+            delay = self.flush_interval if delay is None else delay
+            self._flush_handle = asyncio.get_running_loop().call_later(delay, self._on_flush_timer)
+
+    def _on_flush_timer(self) -> None:
+        self._flush_handle = None
+        self._start_flush()
+
+    def _start_flush(self) -> None:
+        # a running flush re-checks pending price updates when it completes
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self.flush())
+            self._flush_task.add_done_callback(self._on_flush_done)
+
+    def _on_flush_done(self, task: asyncio.Task[None]) -> None:
+        if not task.cancelled() and (exc := task.exception()) is not None:
+            self.client.logger.error("Failed to flush price updates to %s", self.path, exc_info=exc)
+
+    async def flush(self) -> None:
+        """Write pending price updates in a single transaction."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending:
+            return
+        rows, self._pending = self._pending, []
+        try:
+            await self._run(self._write, rows)
+        except BaseException:
+            # keep the rows for the next flush, writes replace stored rows
+            self._pending[:0] = rows
+            self._schedule_flush(self.flush_interval)
+            raise
+        if self._pending:
+            # price updates added during the write
+            self._schedule_flush(0 if len(self._pending) >= self.flush_size else None)
+
+    async def close(self) -> None:
+        """Flush pending price updates and close the database."""
+        await self.flush()
+        await self._run(self._close)
+        self._executor.shutdown(wait=False)
+
+    async def add_item(self, item: UpdateCloseValueItem):
+        self._pending.append((item.asset.value, item.timestamp, item.value))
+        self._schedule_flush()
+        self.invalidate_rollups(item.asset)
+
+    async def add_item_bulk(self, items: list[UpdateCloseValueItem]):
+        self._pending.extend((it.asset.value, it.timestamp, it.value) for it in items)
+        self._schedule_flush()
+        for asset in {it.asset for it in items}:
+            self.invalidate_rollups(asset)
+
+    async def add_item_columns(
+        self,
+        asset: Asset,
+        timestamps: collections.abc.Sequence[float],
+        values: collections.abc.Sequence[float],
+    ) -> None:
+        self._pending.extend(zip(repeat(asset.value), timestamps, values))
+        self._schedule_flush()
+
+    async def add_candles_bulk(self, batch: CandleBatch) -> None:
+        if not len(batch):
+            return
+        periods = await self._get_periods()
+        await self._run(self._write_candles, batch)
+        periods.setdefault(batch.asset, set()).add(batch.timeframe)
+        self.invalidate_rollups(batch.asset)
+
+    async def _get_periods(self) -> dict[Asset, set[int]]:
+        if self._periods is None:
+            periods = await self._run(self._select_periods)
+            if self._periods is None:
+                self._periods = periods
+        return self._periods
+
+    async def _get_candle_period(self, asset: Asset, timeframe: int) -> int | None:
+        periods = await self._get_periods()
+        return max((period for period in periods.get(asset, ()) if timeframe % period == 0), default=None)
+
+    async def _select_candles(
+        self,
+        asset: Asset,
+        period: int,
+        *,
+        start: float | None = None,
+        end: float | None = None,
+    ) -> tuple[CandleBatch, float | None]:
+        return await self._run(self._read_candles, asset, period, start, end)
+
+    async def _get_candle_bounds(self, asset: Asset) -> list[tuple[float, float]]:
+        periods = (await self._get_periods()).get(asset)
+        if not periods:
+            return []
+        return await self._run(self._select_candle_bounds, asset, sorted(periods))
+
+    async def get_item_columns(
+        self,
+        asset: Asset,
+        *,
+        start: datetime.datetime | None = None,
+        end: datetime.datetime | None = None,
+        count: int | None = None,
+    ) -> tuple[array[float], array[float]]:
+        await self.flush()
+        query = "SELECT timestamp, value FROM ticks WHERE asset = ?"
+        params: list[typing.Any] = [asset.value]
+        if start is not None:
+            query += " AND timestamp >= ?"
+            params.append(start.timestamp())
+        if end is not None:
+            query += " AND timestamp <= ?"
+            params.append(end.timestamp())
+        if count is None:
+            rows = await self._run(self._select, query + " ORDER BY timestamp", tuple(params))
+        else:
+            rows = await self._run(self._select, query + " ORDER BY timestamp DESC LIMIT ?", (*params, count))
+            rows.reverse()
+        return array("d", (it[0] for it in rows)), array("d", (it[1] for it in rows))
+
+    async def get_items(
+        self,
+        asset: Asset,
+        *,
+        start: datetime.datetime | None = None,
+        end: datetime.datetime | None = None,
+        count: int | None = None,
+    ) -> collections.abc.Iterable[UpdateCloseValueItem]:
+        timestamps, values = await self.get_item_columns(asset, start=start, end=end, count=count)
+        return [
+            UpdateCloseValueItem.model_construct(asset=asset, timestamp=timestamp, value=value)
+            for timestamp, value in zip(timestamps, values, strict=True)
+        ]
+
+    async def get_first_item(self, asset: Asset) -> UpdateCloseValueItem | None:
+        await self.flush()
+        rows = await self._run(
+            self._select,
+            "SELECT timestamp, value FROM ticks WHERE asset = ? ORDER BY timestamp LIMIT 1",
+            (asset.value,),
+        )
+        if not rows:
+            return None
+        timestamp, value = rows[0]
+        return UpdateCloseValueItem.model_construct(asset=asset, timestamp=timestamp, value=value)
+
+
+class TickJournal:
+    """
+    Append-only binary journal of price updates for a single asset.
+
+    Price updates are written as fixed-width little-endian
+    ``(timestamp, value)`` double pairs, 16 bytes each, into numbered
+    segment files of at most ``segment_size`` records. Appends are O(1);
+    price updates not newer than the last written one are rejected.
+
+    Reads map segment files with :mod:`mmap` and binary-search records
+    in place. Segments are located by binary search over their first
+    timestamps, so a range lookup touches only the segments it overlaps.
+    """
+
+    __slots__ = ("_counts", "_file", "_maps", "_starts", "last_timestamp", "path", "segment_size", "segments")
+
+    RECORD = struct.Struct("<dd")
+
+    def __init__(self, path: pathlib.Path, segment_size: int) -> None:
+        self.path = path
+        self.segment_size = segment_size
+        self.segments: list[pathlib.Path] = sorted(path.glob("*.seg")) if path.is_dir() else []
+        self._starts: list[float] = []
+        self._counts: list[int] = []
+        self._maps: dict[int, mmap.mmap] = {}
+        self._file: io.BufferedWriter | None = None
+        self.last_timestamp = -math.inf
+
+        for segment in self.segments:
+            count, rest = divmod(segment.stat().st_size, self.RECORD.size)
+            if rest:
+                # partially written record, e.g. after a crash
+                with segment.open("r+b") as file:
+                    file.truncate(count * self.RECORD.size)
+            with segment.open("rb") as file:
+                # empty segments keep the starts sorted until their first write
+                first = self.RECORD.unpack(file.read(self.RECORD.size))[0] if count else self.last_timestamp
+                if count:
+                    file.seek((count - 1) * self.RECORD.size)
+                    self.last_timestamp = self.RECORD.unpack(file.read(self.RECORD.size))[0]
+            self._starts.append(first)
+            self._counts.append(count)
+
+    def __len__(self) -> int:
+        return sum(self._counts)
+
+    def append(self, timestamps: collections.abc.Iterable[float], values: collections.abc.Iterable[float]) -> int:
+        """
+        Append price updates ordered by timestamp.
+
+        :return: Number of written price updates.
+        :rtype: int
+        """
+        total = written = 0
+        last = self.last_timestamp
+        records = bytearray()
+        for timestamp, value in zip(timestamps, values, strict=True):
+            if timestamp <= last:
+                continue
+            if not self.segments or self._counts[-1] + written == self.segment_size:
+                self._write(records, written)
+                records.clear()
+                written = 0
+                self._open_segment(timestamp)
+            records += self.RECORD.pack(timestamp, value)
+            last = timestamp
+            written += 1
+            total += 1
+        self._write(records, written)
+        self.last_timestamp = last
+        return total
+
+    def _write(self, records: bytearray, count: int) -> None:
+        if count:
+            if self._file is None:
+                self._file = self.segments[-1].open("ab")
+            if not self._counts[-1]:
+                # segment left empty, e.g. by a crash right after it was created
+                self._starts[-1] = self.RECORD.unpack_from(records)[0]
+            self._file.write(records)
+            self._counts[-1] += count
+
+    def _open_segment(self, timestamp: float) -> None:
+        if self._file is not None:
+            self._file.close()
+        self.path.mkdir(parents=True, exist_ok=True)
+        segment = self.path / f"{len(self.segments):08d}.seg"
+        self.segments.append(segment)
+        self._starts.append(timestamp)
+        self._counts.append(0)
+        self._file = segment.open("ab")
+
+    def flush(self) -> None:
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        for records in self._maps.values():
+            records.close()
+        self._maps.clear()
+
+    @contextlib.contextmanager
+    def _records(self, index: int) -> collections.abc.Iterator[collections.abc.Sequence[float]]:
+        sealed = index < len(self.segments) - 1
+        records = self._maps.get(index) if sealed else None
+        if records is None:
+            if not sealed:
+                self.flush()
+            with self.segments[index].open("rb") as file:
+                records = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            if sealed:
+                self._maps[index] = records
+        try:
+            if sys.byteorder == "little":
+                with memoryview(records) as raw, raw.cast("d") as view:
+                    yield view
+            else:
+                swapped = array("d", records)
+                swapped.byteswap()
+                yield swapped
+        finally:
+            if not sealed:
+                records.close()
+
+    def first(self) -> tuple[float, float] | None:
+        """
+        Get the oldest price update.
+
+        :return: Timestamp and value or None if the journal is empty.
+        :rtype: tuple[float, float] | None
+        """
+        for index, count in enumerate(self._counts):
+            if count:
+                with self._records(index) as records:
+                    return records[0], records[1]
+        return None
+
+    def select(
+        self,
+        start: float | None = None,
+        end: float | None = None,
+        count: int | None = None,
+    ) -> tuple[array[float], array[float]]:
+        """
+        Select price updates by timestamp range.
+
+        :param start: Minimum timestamp (inclusive).
+        :type start: float | None
+
+        :param end: Maximum timestamp (inclusive).
+        :type end: float | None
+
+        :param count: Maximum number of latest price updates.
+        :type count: int | None
+
+        :return: Timestamps and values ordered by timestamp.
+        :rtype: tuple[array[float], array[float]]
+        """
+        first = 0 if start is None else max(bisect.bisect_right(self._starts, start) - 1, 0)
+        last = len(self.segments) if end is None else bisect.bisect_right(self._starts, end)
+
+        ranges: list[tuple[int, int, int]] = []
+        remaining = math.inf if count is None else count
+        for index in range(last - 1, first - 1, -1):
+            if remaining <= 0:
+                break
+            size = self._counts[index]
+            if not size:
+                continue
+            with self._records(index) as records:
+                lo = 0 if start is None else bisect.bisect_left(range(size), start, key=lambda i: records[2 * i])
+                hi = size if end is None else bisect.bisect_right(range(size), end, lo, key=lambda i: records[2 * i])
+            lo = max(lo, hi - remaining)  # type: ignore
+            if lo < hi:
+                ranges.append((index, lo, hi))
+                remaining -= hi - lo
+
+        timestamps, values = array("d"), array("d")
+        for index, lo, hi in reversed(ranges):
+            with self._records(index) as records:
+                timestamps.extend(records[2 * lo : 2 * hi : 2])
+                values.extend(records[2 * lo + 1 : 2 * hi : 2])
+        return timestamps, values
+
+
+class CandleJournal:
+    """
+    Binary file of complete candles of a single asset and period.
+
+    Candles are written as fixed-width little-endian
+    ``(timestamp, open, high, low, close, volume)`` double records, 48 bytes
+    each, ordered by timestamp. Candles newer than the last stored one are
+    appended; a batch overlapping stored candles is merged into them
+    (candles with already stored timestamps are replaced) and the file is
+    replaced atomically, so reloading the same history does not grow it.
+
+    Reads map the file with :mod:`mmap` and binary-search records in place.
+    """
+
+    __slots__ = ("asset", "first_timestamp", "last_timestamp", "path", "period")
+
+    FIELDS = 6
+    RECORD = struct.Struct(f"<{FIELDS}d")
+
+    def __init__(self, path: pathlib.Path, asset: Asset, period: int) -> None:
+        self.path = path
+        self.asset = asset
+        self.period = period
+        self.first_timestamp: float | None = None
+        self.last_timestamp: float | None = None
+
+        if path.is_file():
+            count, rest = divmod(path.stat().st_size, self.RECORD.size)
+            if rest:
+                # partially written record, e.g. after a crash
+                with path.open("r+b") as file:
+                    file.truncate(count * self.RECORD.size)
+            if count:
+                with path.open("rb") as file:
+                    self.first_timestamp = self.RECORD.unpack(file.read(self.RECORD.size))[0]
+                    file.seek((count - 1) * self.RECORD.size)
+                    self.last_timestamp = self.RECORD.unpack(file.read(self.RECORD.size))[0]
+
+    def _pack(self, batch: CandleBatch) -> bytes:
+        pack = self.RECORD.pack
+        return b"".join(pack(*row) for row in zip(*batch.columns().values(), strict=True))
+
+    def merge(self, batch: CandleBatch) -> None:
+        """
+        Store complete candles.
+
+        :param batch: Candles of the journal period ordered by timestamp.
+        :type batch: CandleBatch
+        """
+        if not len(batch):
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.last_timestamp is None or batch.timestamps[0] > self.last_timestamp:
+            with self.path.open("ab") as file:
+                file.write(self._pack(batch))
+        else:
+            series = CandleSeries(self.asset, self.period, sys.maxsize)
+            series.merge(self.select())
+            series.merge(batch)
+            batch = series.candles
+            temp = self.path.with_suffix(".tmp")
+            temp.write_bytes(self._pack(batch))
+            temp.replace(self.path)
+        self.last_timestamp = float(batch.timestamps[-1])
+        if self.first_timestamp is None or batch.timestamps[0] < self.first_timestamp:
+            self.first_timestamp = float(batch.timestamps[0])
+
+    def select(self, start: float | None = None, end: float | None = None) -> CandleBatch:
+        """
+        Select candles by timestamp range.
+
+        :param start: Minimum candle timestamp (inclusive).
+        :type start: float | None
+
+        :param end: Maximum candle timestamp (inclusive).
+        :type end: float | None
+
+        :return: Candles ordered by timestamp.
+        :rtype: CandleBatch
+        """
+        batch = CandleBatch.empty(self.asset, self.period)
+        if self.last_timestamp is None:
+            return batch
+        size = self.FIELDS
+        with self._records() as records:
+            count = len(records) // size
+            lo = 0 if start is None else bisect.bisect_left(range(count), start, key=lambda i: records[size * i])
+            hi = count if end is None else bisect.bisect_right(range(count), end, lo, key=lambda i: records[size * i])
+            for offset, column in enumerate(batch.columns().values()):
+                column.extend(records[size * lo + offset : size * hi : size])  # type: ignore
+        return batch
+
+    @contextlib.contextmanager
+    def _records(self) -> collections.abc.Iterator[collections.abc.Sequence[float]]:
+        with self.path.open("rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as records:
+            if sys.byteorder == "little":
+                with memoryview(records) as raw, raw.cast("d") as view:
+                    yield view
+            else:
+                swapped = array("d", records)
+                swapped.byteswap()
+                yield swapped
+
+
+class JournalCandleStorage(CandleStorage):
+    """
+    File-based candle storage built on append-only tick journals.
+
+    Every asset gets a :class:`TickJournal` in its own directory under
+    ``path``. Writes are O(1) appends of 16-byte records, reads map the
+    segment files with :mod:`mmap`, so histories far larger than memory
+    can be stored. Live price updates not newer than the last stored one
+    are dropped.
+
+    Complete candles (history) are stored natively per period in a
+    :class:`CandleJournal` under ``<asset>/candles``. Candles with a
+    timeframe that is a multiple of a stored period are built from the
+    stored candles, with price updates extending the newest stored candle
+    and opening newer ones; other timeframes are aggregated from raw
+    price updates.
+
+    All journal calls run in a dedicated worker thread, so the event
+    loop is never blocked by disk I/O.
+
+    Example:
+
+        storage = JournalCandleStorage(client, path="ticks")
+        ...
+        candles = await storage.get_candles(Asset.AUDCAD_otc, timeframe=60)
+        ...
+        await storage.close()
+    """
+
+    def __init__(
+        self,
+        client: PocketOptionClient,
+        *,
+        path: str | os.PathLike[str] = "ticks",
+        segment_size: int = 1 << 20,
+    ) -> None:
+        super().__init__(client)
+        self.path = pathlib.Path(path)
+        self.segment_size = segment_size
+
+        # journals are only accessed from the worker thread
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="JournalCandleStorage")
+        self._journals: dict[Asset, TickJournal] = {}
+        self._candles: dict[Asset, dict[int, CandleJournal]] = {}
+        # stored candle periods per asset, loaded on first use
+        self._periods: dict[Asset, set[int]] = {}
+
+        self.client.on.disconnect(self._on_disconnect)
+
+    async def _on_disconnect(self) -> None:
+        await self.flush()
+
+    async def _run[T](self, func: typing.Callable[..., T], *args: typing.Any) -> T:
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    def _get_journal(self, asset: Asset) -> TickJournal:
+        journal = self._journals.get(asset)
+        if journal is None:
+            journal = self._journals[asset] = TickJournal(self.path / asset.value, self.segment_size)
+        return journal
+
+    def _get_candle_journals(self, asset: Asset) -> dict[int, CandleJournal]:
+        journals = self._candles.get(asset)
+        if journals is None:
+            path = self.path / asset.value / "candles"
+            periods = sorted(int(it.stem) for it in path.glob("*.bin")) if path.is_dir() else []
+            journals = self._candles[asset] = {
+                period: CandleJournal(path / f"{period}.bin", asset, period) for period in periods
+            }
+        return journals
+
+    def _append(
+        self,
+        asset: Asset,
+        timestamps: collections.abc.Sequence[float],
+        values: collections.abc.Sequence[float],
+    ) -> int:
+        return len(timestamps) - self._get_journal(asset).append(timestamps, values)
+
+    def _merge_candles(self, batch: CandleBatch) -> None:
+        journals = self._get_candle_journals(batch.asset)
+        journal = journals.get(batch.timeframe)
+        if journal is None:
+            path = self.path / batch.asset.value / "candles" / f"{batch.timeframe}.bin"
+            journal = journals[batch.timeframe] = CandleJournal(path, batch.asset, batch.timeframe)
+        journal.merge(batch)
+
+    def _select(
+        self,
+        asset: Asset,
+        start: float | None,
+        end: float | None,
+        count: int | None,
+    ) -> tuple[array[float], array[float]]:
+        return self._get_journal(asset).select(start, end, count)
+
+    def _read_candles(
+        self,
+        asset: Asset,
+        period: int,
+        start: float | None,
+        end: float | None,
+    ) -> tuple[CandleBatch, float | None]:
+        journal = self._get_candle_journals(asset)[period]
+        return journal.select(start, end), journal.last_timestamp
+
+    def _read_first(self, asset: Asset) -> tuple[float, float] | None:
+        return self._get_journal(asset).first()
+
+    def _read_candle_bounds(self, asset: Asset) -> list[tuple[float, float]]:
+        return [
+            (journal.first_timestamp, journal.last_timestamp)
+            for journal in self._get_candle_journals(asset).values()
+            if journal.first_timestamp is not None and journal.last_timestamp is not None
+        ]
+
+    def _flush(self) -> None:
+        for journal in self._journals.values():
+            journal.flush()
+
+    def _close(self) -> None:
+        for journal in self._journals.values():
+            journal.close()
+        self._journals.clear()
+        self._candles.clear()
+
+    async def flush(self) -> None:
+        """Flush buffered writes of all journals to the OS."""
+        await self._run(self._flush)
+
+    async def close(self) -> None:
+        """Close all journal files."""
+        await self._run(self._close)
+        self._executor.shutdown(wait=False)
+
+    async def add_item(self, item: UpdateCloseValueItem):
+        await self.add_item_columns(item.asset, (item.timestamp,), (item.value,))
+        self.invalidate_rollups(item.asset)
+
+    async def add_item_bulk(self, items: list[UpdateCloseValueItem]):
+        columns: dict[Asset, list[UpdateCloseValueItem]] = {}
+        for it in items:
+            columns.setdefault(it.asset, []).append(it)
+        for asset, group in columns.items():
+            group.sort(key=lambda it: it.timestamp)
+            await self.add_item_columns(asset, [it.timestamp for it in group], [it.value for it in group])
+            self.invalidate_rollups(asset)
+
+    async def add_item_columns(
+        self,
+        asset: Asset,
+        timestamps: collections.abc.Sequence[float],
+        values: collections.abc.Sequence[float],
+    ) -> None:
+        dropped = await self._run(self._append, asset, timestamps, values)
+        if dropped:
+            self.client.logger.debug("Dropped %d price updates of %s not newer than stored ones", dropped, asset)
+
+    async def add_candles_bulk(self, batch: CandleBatch) -> None:
+        if not len(batch):
+            return
+        periods = await self._get_periods(batch.asset)
+        await self._run(self._merge_candles, batch)
+        periods.add(batch.timeframe)
+        self.invalidate_rollups(batch.asset)
+
+    async def _get_periods(self, asset: Asset) -> set[int]:
+        periods = self._periods.get(asset)
+        if periods is None:
+            journals = await self._run(self._get_candle_journals, asset)
+            periods = self._periods.setdefault(asset, set(journals))
+        return periods
+
+    async def _get_candle_period(self, asset: Asset, timeframe: int) -> int | None:
+        periods = await self._get_periods(asset)
+        return max((period for period in periods if timeframe % period == 0), default=None)
+
+    async def _select_candles(
+        self,
+        asset: Asset,
+        period: int,
+        *,
+        start: float | None = None,
+        end: float | None = None,
+    ) -> tuple[CandleBatch, float | None]:
+        return await self._run(self._read_candles, asset, period, start, end)
+
+    async def _get_candle_bounds(self, asset: Asset) -> list[tuple[float, float]]:
+        if not await self._get_periods(asset):
+            return []
+        return await self._run(self._read_candle_bounds, asset)
+
+    async def get_item_columns(
+        self,
+        asset: Asset,
+        *,
+        start: datetime.datetime | None = None,
+        end: datetime.datetime | None = None,
+        count: int | None = None,
+    ) -> tuple[array[float], array[float]]:
+        return await self._run(
+            self._select,
+            asset,
+            start.timestamp() if start else None,
+            end.timestamp() if end else None,
+            count,
+        )
+
+    async def get_items(
+        self,
+        asset: Asset,
+        *,
+        start: datetime.datetime | None = None,
+        end: datetime.datetime | None = None,
+        count: int | None = None,
+    ) -> collections.abc.Iterable[UpdateCloseValueItem]:
+        timestamps, values = await self.get_item_columns(asset, start=start, end=end, count=count)
+        return [
+            UpdateCloseValueItem.model_construct(asset=asset, timestamp=timestamp, value=value)
+            for timestamp, value in zip(timestamps, values, strict=True)
+        ]
+
+    async def get_first_item(self, asset: Asset) -> UpdateCloseValueItem | None:
+        first = await self._run(self._read_first, asset)
+        if first is None:
+            return None
+        return UpdateCloseValueItem.model_construct(asset=asset, timestamp=first[0], value=first[1])
+
+
+class _OpenCandle:
+    __slots__ = ("close", "high", "low", "open", "timestamp", "volume")
+
+    def __init__(self, timestamp: int, value: float) -> None:
+        self.timestamp = timestamp
+        self.open = self.high = self.low = self.close = value
+        self.volume = 1
+
+
+class LiveCandleBuilder:
+    """
+    Incremental candle builder for live price updates.
+
+    The builder subscribes to PocketOption price stream and keeps
+    the current open candle per (asset, timeframe). Each price update
+    is applied in O(1) without re-aggregating stored price updates.
+
+    A candle is closed when the first price update of a newer bucket
+    arrives. Closed candles are passed to handlers registered with
+    :meth:`on_candle_closed`. Price updates older than the current
+    open candle are ignored.
+
+    Example:
+
+        builder = LiveCandleBuilder(client, timeframes=[5, 60])
+
+        @builder.on_candle_closed()
+        async def on_candle_closed(candle: Candle) -> None:
+            ...
+    """
+
+    def __init__(
+        self,
+        client: PocketOptionClient,
+        timeframes: collections.abc.Iterable[int] = (5,),
+        *,
+        assets: collections.abc.Iterable[Asset] | None = None,
+    ) -> None:
+        """
+        :param client: PocketOption client.
+        :type client: PocketOptionClient
+
+        :param timeframes: Candle sizes in seconds.
+        :type timeframes: collections.abc.Iterable[int]
+
+        :param assets: Assets to build candles for. All assets when omitted.
+        :type assets: collections.abc.Iterable[Asset] | None
+        """
+        self.client = client
+        self.timeframes = tuple(sorted(set(timeframes)))
+        self.assets = frozenset(assets) if assets is not None else None
+        self._candles: dict[tuple[Asset, int], _OpenCandle] = {}
+        self._handlers: list[TypedEventListener[Candle]] = []
+
+        self.client.on.update_close_value(self._on_update_stream, batch=True)
+
+    @typing.overload
+    def on_candle_closed(
+        self,
+        handler: None = None,
+    ) -> typing.Callable[[TypedEventListener[Candle]], None]: ...
+    @typing.overload
+    def on_candle_closed(self, handler: TypedEventListener[Candle]) -> None: ...
+    def on_candle_closed(
+        self,
+        handler: TypedEventListener[Candle] | None = None,
+    ) -> None | typing.Callable[[TypedEventListener[Candle]], None]:
+        """
+        Register closed candle handler.
+
+        :param handler: Callback
+        :type handler: TypedEventListener[Candle] | None
+        """
+
+        def set_handler(_handler: TypedEventListener[Candle]) -> None:
+            self._handlers.append(_handler)
+
+        if handler:
+            return set_handler(handler)
+        return set_handler
+
+    def get_open_candle(self, asset: Asset, timeframe: int) -> Candle | None:
+        """
+        Get the current open candle.
+
+        :param asset: Asset.
+        :type asset: Asset
+
+        :param timeframe: Candle size in seconds.
+        :type timeframe: int
+
+        :return: Open candle or None if no price updates were received.
+        :rtype: Candle | None
+        """
+        if candle := self._candles.get((asset, timeframe)):
+            return self._make_candle(asset, timeframe, candle)
+        return None
+
+    async def _on_update_stream(self, batch: TickBatch) -> None:
+        closed = []
+        for item in batch.ticks():
+            if self.assets is not None and item.asset not in self.assets:
+                continue
+            for timeframe in self.timeframes:
+                ts_bucket = math.floor(item.timestamp / timeframe) * timeframe
+                key = (item.asset, timeframe)
+                candle = self._candles.get(key)
+                if candle is None or ts_bucket > candle.timestamp:
+                    if candle is not None:
+                        closed.append(self._make_candle(item.asset, timeframe, candle))
+                    self._candles[key] = _OpenCandle(ts_bucket, item.value)
+                elif ts_bucket == candle.timestamp:
+                    candle.high = max(candle.high, item.value)
+                    candle.low = min(candle.low, item.value)
+                    candle.close = item.value
+                    candle.volume += 1
+
+        for candle in closed:
+            await self._emit_candle_closed(candle)
+
+    async def _emit_candle_closed(self, candle: Candle) -> None:
+        for handler in self._handlers:
+            try:
+                result = handler(candle)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception:
+                self.client.logger.exception("Error on candle closed handler %s", get_function_full_name(handler))
+
+    @staticmethod
+    def _make_candle(asset: Asset, timeframe: int, candle: _OpenCandle) -> Candle:
+        return Candle.model_construct(
+            asset=asset,
+            timestamp=datetime.datetime.fromtimestamp(candle.timestamp, tz=pytz.UTC),
+            timeframe=timeframe,
+            open=candle.open,
+            high=candle.high,
+            low=candle.low,
+            close=candle.close,
+            volume=candle.volume,
+        )
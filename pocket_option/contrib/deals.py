@@ -2,10 +2,18 @@ from __future__ import annotations
 
 import abc
 import asyncio
-import contextlib
+import bisect
+import datetime
+import enum
 import itertools
 import logging
+import operator
+import pathlib
+import sqlite3
 import typing
+import uuid
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 from pocket_option.constants import (
     API_LIMITS_MAX_CONCURRENT_ORDERS,
@@ -17,18 +25,21 @@ from pocket_option.constants import (
 from pocket_option.errors import DealError
 from pocket_option.generated_client import PocketOptionClient
 from pocket_option.models import Asset, Deal, DealAction, IsDemo, OpenDealRequest, SuccessCloseDealEvent
-from pocket_option.utils import Q, append_or_replace, generate_request_id
+from pocket_option.utils import Q, generate_request_id
 
 if typing.TYPE_CHECKING:
     import collections.abc
-    import uuid
+    import os
 
     from pocket_option.generated_client import PocketOptionClient
 
-__all__ = ("DealsStorage", "MemoryDealsStorage")
+__all__ = ("DealsStorage", "MemoryDealsStorage", "SQLiteDealsStorage")
 
 logger = logging.getLogger("pocket_option.deals")
 
+_SQL_OPERATORS = {"eq": "=", "gt": ">", "gte": ">=", "lt": "<", "lte": "<="}
+_SQL_LOOKUPS = frozenset({*_SQL_OPERATORS, "ne", "in", "between", "startswith", "isnull"})
+
 
 class DealsStorage:
     """
@@ -77,11 +88,12 @@ class DealsStorage:
 
         self._open_deal_events: dict[int, asyncio.Event] = {}
         self._close_deal_events: dict[uuid.UUID, asyncio.Event] = {}
+        self._open_deals: defaultdict[int, set[uuid.UUID]] = defaultdict(set)
 
         self.client.on.deals_success_open(self._on_success_open_deal)
         self.client.on.deals_success_close(self._on_success_close_deal)
-        self.client.on.deals_update_opened(self.add_or_update_deal_bulk)
-        self.client.on.deals_update_closed(self.add_or_update_deal_bulk)
+        self.client.on.deals_update_opened(self._on_update_opened_deals)
+        self.client.on.deals_update_closed(self._on_update_closed_deals)
 
         self.client.deals = self
 
@@ -178,15 +190,13 @@ class DealsStorage:
             if not self.client.authorization_data:
                 self.client.logger.warning("Failed to check concurent orders: no authorization data")
             if self.client.authorization_data:
-                orders = await self.get_deals(
-                    query=Q.field("uid", "eq", self.client.authorization_data.uid) & Q.field("closed", "eq", False),
-                )
-                if len(list(orders)) > API_LIMITS_MAX_CONCURRENT_ORDERS:
+                orders_count = self.count_open_deals(self.client.authorization_data.uid)
+                if orders_count > API_LIMITS_MAX_CONCURRENT_ORDERS:
                     raise DealError(
                         "max_orders",
                         "Max concurent orders count reached",
                         extras={
-                            "count": len(list(orders)),
+                            "count": orders_count,
                             "limit": API_LIMITS_MAX_CONCURRENT_ORDERS,
                         },
                     )
@@ -291,14 +301,51 @@ class DealsStorage:
             return deal
         raise RuntimeError("Failed to find deal")
 
+    def count_open_deals(self, uid: int) -> int:
+        """
+        Get number of currently opened deals.
+
+        The counter is maintained from deal open/close events and opened
+        deals synchronization, so no storage query is performed.
+
+        :param uid: PocketOption user identifier
+        :type uid: int
+
+        :return: Number of opened deals
+        :rtype: int
+        """
+        return len(self._open_deals.get(uid, ()))
+
+    def _track_open_deals(self, deals: collections.abc.Iterable[Deal], *, closed: bool = False) -> None:
+        for deal in deals:
+            if closed or deal.closed:
+                self._open_deals[deal.uid].discard(deal.id)
+            else:
+                self._open_deals[deal.uid].add(deal.id)
+
+    async def _on_update_opened_deals(self, deals: list[Deal]) -> None:
+        await self.add_or_update_deal_bulk(deals)
+        uids = {deal.uid for deal in deals}
+        if self.client.authorization_data:
+            uids.add(self.client.authorization_data.uid)
+        for uid in uids:
+            self._open_deals[uid] = set()
+        self._track_open_deals(deals)
+
+    async def _on_update_closed_deals(self, deals: list[Deal]) -> None:
+        await self.add_or_update_deal_bulk(deals)
+        self._track_open_deals(deals, closed=True)
+
     async def _on_success_open_deal(self, deal: Deal):
         await self.add_or_update_deal(deal)
+        self._track_open_deals([deal])
         if deal.request_id and self._open_deal_events.get(deal.request_id):
             self._open_deal_events[deal.request_id].set()
             del self._open_deal_events[deal.request_id]
 
     async def _on_success_close_deal(self, close_deal: SuccessCloseDealEvent) -> None:
         await self.add_or_update_deal_bulk(close_deal.deals)
+        self._track_open_deals(close_deal.deals, closed=True)
         for deal in close_deal.deals:
             if event := self._close_deal_events.pop(deal.id, None):
                 event.set()
@@ -356,27 +403,81 @@ class MemoryDealsStorage(DealsStorage):
     In-memory deals storage.
 
     Stores deals in process memory.
+
+    Deals are indexed by ``id`` and ``request_id``, kept ordered by
+    ``open_time`` and grouped by ``asset``, ``uid`` and ``closed``
+    secondary indexes. Indexes are updated incrementally on every
+    insert, so adding or looking up a deal does not scan the history.
+
+    :meth:`get_deals` answers top-level lookups on indexed fields (see
+    ``INDEX_LOOKUPS``) from the indexes: ``eq``/``in`` are hash probes,
+    ``startswith`` scans the asset index keys and range lookups on
+    ``open_time`` bisect the ordered history. The rest of the query is
+    evaluated only for the matching deals. Queries that have to scan the
+    whole history are evaluated in bulk over cached per-field columns
+    (see :meth:`~pocket_option.utils.Q.mask`); the columns are dropped
+    whenever a deal changes.
     """
 
+    INDEXED_FIELDS = ("asset", "uid", "closed")
+    INDEX_LOOKUPS: typing.ClassVar[dict[str, frozenset[str]]] = {
+        "id": frozenset({"eq", "in"}),
+        "request_id": frozenset({"eq", "in"}),
+        **{field: frozenset({"eq", "in"}) for field in INDEXED_FIELDS},
+        "asset": frozenset({"eq", "in", "startswith"}),
+        "open_time": frozenset({"gt", "gte", "lt", "lte", "between"}),
+    }
+
     def __init__(self, client: PocketOptionClient) -> None:
         super().__init__(client)
-        self._deals: list[Deal] = []
+        self._deals: dict[uuid.UUID, Deal] = {}
+        self._request_ids: dict[int, uuid.UUID] = {}
+        self._timeline: list[tuple[float, uuid.UUID]] = []
+        self._indexes: dict[str, defaultdict[typing.Any, set[uuid.UUID]]] = {
+            field: defaultdict(set) for field in self.INDEXED_FIELDS
+        }
+        self._rows: list[Deal] | None = None
+        self._columns: dict[str, list[typing.Any]] = {}
+
+    def _index(self, deal: Deal, old: Deal | None) -> None:
+        if old is not None:
+            if old.request_id and self._request_ids.get(old.request_id) == old.id:
+                del self._request_ids[old.request_id]
+            if old.open_time != deal.open_time:
+                key = (old.open_time.timestamp(), old.id)
+                index = bisect.bisect_left(self._timeline, key)
+                if index < len(self._timeline) and self._timeline[index] == key:
+                    del self._timeline[index]
+            for field, index_map in self._indexes.items():
+                value = getattr(old, field)
+                ids = index_map[value]
+                ids.discard(old.id)
+                if not ids:
+                    del index_map[value]
+
+        if deal.request_id:
+            self._request_ids[deal.request_id] = deal.id
+        if old is None or old.open_time != deal.open_time:
+            bisect.insort(self._timeline, (deal.open_time.timestamp(), deal.id))
+        for field, index_map in self._indexes.items():
+            index_map[getattr(deal, field)].add(deal.id)
 
     async def add_or_update_deal(self, deal: Deal) -> None:
-        self._deals = append_or_replace(self._deals, deal, eq_by_keys=["id"])
+        old = self._deals.get(deal.id)
+        self._deals[deal.id] = deal
+        self._index(deal, old)
+        self._rows = None
+        self._columns.clear()
 
     async def add_or_update_deal_bulk(self, deals: list[Deal]) -> None:
         for deal in deals:
             await self.add_or_update_deal(deal)
 
     async def get_deal(self, *, deal_id: uuid.UUID | None = None, request_id: int | None = None) -> Deal | None:
-        if deal_id:
-            with contextlib.suppress(StopIteration):
-                return next(deal for deal in self._deals if deal.id == deal_id)
-
-        if request_id:
-            with contextlib.suppress(StopIteration):
-                return next(deal for deal in self._deals if deal.request_id == request_id)
+        if deal_id and (deal := self._deals.get(deal_id)):
+            return deal
+        if request_id and (deal_id := self._request_ids.get(request_id)):
+            return self._deals.get(deal_id)
         return None
 
     async def get_deals(
@@ -406,18 +507,385 @@ class MemoryDealsStorage(DealsStorage):
         :param query: Deal filter expression
         :type query: Q
 
-        :param count: Maximum number of returned deals
+        :param count: Maximum number of latest returned deals
         :type count: int | None
 
-        :return: Iterable of deals
+        :return: Iterable of deals ordered by open time
         :rtype: collections.abc.Iterable[Deal]
         """
-        data = self._deals.copy()
+        if query is None:
+            return self._select(None, query=None, count=count)
+        plan = query.plan(self.INDEX_LOOKUPS)
+        return self._select(self._lookup(plan.lookups), query=plan.residual, count=count)
+
+    def _lookup(self, lookups: collections.abc.Iterable[tuple[str, str, typing.Any]]) -> set[uuid.UUID] | None:
+        ids: set[uuid.UUID] | None = None
+        for field, op, value in lookups:
+            if field == "open_time":
+                found = self._lookup_range(op, value)
+            elif op == "in":
+                found = set().union(*(self._lookup_eq(field, it) for it in value))
+            elif op == "startswith":
+                found = set().union(*(ids for key, ids in self._indexes[field].items() if key.startswith(value)))
+            else:
+                found = self._lookup_eq(field, value)
+            ids = found if ids is None else ids & found
+        return ids
+
+    def _lookup_eq(self, field: str, value: typing.Any) -> set[uuid.UUID]:
+        if field == "id":
+            return {value} if value in self._deals else set()
+        if field == "request_id" and not value:
+            # deals without request id are not indexed
+            return {deal.id for deal in self._deals.values() if deal.request_id == value}
+        if field == "request_id":
+            return {self._request_ids[value]} if value in self._request_ids else set()
+        return self._indexes[field].get(value, set())
+
+    def _lookup_range(self, op: str, value: typing.Any) -> set[uuid.UUID]:
+        start, stop = 0, len(self._timeline)
+        low, high = value if op == "between" else (value, value)
+        if op in {"gt", "gte", "between"}:
+            bisector = bisect.bisect_right if op == "gt" else bisect.bisect_left
+            start = bisector(self._timeline, low, key=operator.itemgetter(0))
+        if op in {"lt", "lte", "between"}:
+            bisector = bisect.bisect_left if op == "lt" else bisect.bisect_right
+            stop = bisector(self._timeline, high, key=operator.itemgetter(0))
+        return {deal_id for _, deal_id in self._timeline[start:stop]}
+
+    async def filter_deals(
+        self,
+        *,
+        asset: Asset | None = None,
+        uid: int | None = None,
+        closed: bool | None = None,
+        query: Q | None = None,
+        count: int | None = None,
+    ) -> list[Deal]:
+        """
+        Query stored deals using secondary indexes.
 
-        if query:
-            data = [deal for deal in data if query(deal)]
+        Deals matching all given index values are taken from the indexes
+        without scanning the history; ``query`` is applied to them only.
 
-        data = sorted(data, key=lambda it: it.open_time)
+        Example:
+
+            deals = await storage.filter_deals(
+                uid=client.authorization_data.uid,
+                closed=False,
+            )
+
+        :param asset: Deal asset
+        :type asset: Asset | None
+
+        :param uid: PocketOption user identifier
+        :type uid: int | None
+
+        :param closed: Deal close state
+        :type closed: bool | None
+
+        :param query: Additional deal filter expression
+        :type query: Q | None
+
+        :param count: Maximum number of latest returned deals
+        :type count: int | None
+
+        :return: List of deals ordered by open time
+        :rtype: list[Deal]
+        """
+        filters = {"asset": asset, "uid": uid, "closed": closed}
+        ids: set[uuid.UUID] | None = None
+        for field, value in filters.items():
+            if value is None:
+                continue
+            found = self._indexes[field].get(value, set())
+            ids = found if ids is None else ids & found
+        return self._select(ids, query=query, count=count)
+
+    def _select(
+        self,
+        ids: collections.abc.Collection[uuid.UUID] | None,
+        *,
+        query: Q | None,
+        count: int | None,
+    ) -> list[Deal]:
+        if ids is None and query and (names := query.field_names()):
+            rows = self._get_rows()
+            mask = query.mask({name: self._get_column(name) for name in sorted(names)})
+            result = list(itertools.compress(rows, mask))
+            return result[-count:] if count else result
+        if ids is None:
+            data = (self._deals[deal_id] for _, deal_id in reversed(self._timeline))
+        else:
+            data = iter(
+                sorted(
+                    (self._deals[deal_id] for deal_id in ids),
+                    key=lambda it: (it.open_time.timestamp(), it.id),
+                    reverse=True,
+                ),
+            )
+        if query:
+            data = filter(query, data)
         if count:
-            data = itertools.islice(data, -count)
-        return data
+            data = itertools.islice(data, count)
+        result = list(data)
+        result.reverse()
+        return result
+
+    def _get_rows(self) -> list[Deal]:
+        if self._rows is None:
+            self._rows = [self._deals[deal_id] for _, deal_id in self._timeline]
+        return self._rows
+
+    def _get_column(self, name: str) -> list[typing.Any]:
+        column = self._columns.get(name)
+        if column is None:
+            column = self._columns[name] = [getattr(deal, name) for deal in self._get_rows()]
+        return column
+
+
+class SQLiteDealsStorage(DealsStorage):
+    """
+    SQLite deals storage.
+
+    Deals are stored in a ``deals`` table keyed by ``id``. The ``request_id``,
+    ``uid``, ``asset``, ``open_time`` and ``closed`` columns are indexed.
+    The full deal is kept as JSON next to them.
+
+    :class:`~pocket_option.utils.Q` expressions over the columns listed
+    in ``COLUMNS`` are translated into SQL ``WHERE`` clauses. Top-level
+    ``&`` parts that cannot be translated are applied in Python to the
+    rows selected by the rest of the query.
+
+    All database calls run in a dedicated worker thread, so the event
+    loop is never blocked by disk I/O.
+
+    Example:
+
+        storage = SQLiteDealsStorage(client, path="deals.sqlite3")
+
+        deals = await storage.get_deals(
+            query=Q.field("asset", "eq", Asset.AUDCAD_otc) & Q.field("closed", "eq", True),
+            count=10,
+        )
+    """
+
+    COLUMNS = ("id", "request_id", "uid", "asset", "open_time", "close_time", "closed", "amount", "profit")
+    INDEXED_COLUMNS = ("request_id", "uid", "asset", "open_time", "closed")
+    # columns holding ``str`` values on the model, ``startswith`` never matches other columns
+    STRING_COLUMNS = ("asset",)
+
+    def __init__(self, client: PocketOptionClient, *, path: str | os.PathLike[str] = "deals.sqlite3") -> None:
+        super().__init__(client)
+        self.path = pathlib.Path(path)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="SQLiteDealsStorage")
+        self._connection: sqlite3.Connection | None = None
+
+    async def _run[T](self, func: typing.Callable[..., T], *args: typing.Any) -> T:
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS deals ("
+                "id TEXT PRIMARY KEY, "
+                "request_id INTEGER, "
+                "uid INTEGER NOT NULL, "
+                "asset TEXT NOT NULL, "
+                "open_time REAL NOT NULL, "
+                "close_time REAL NOT NULL, "
+                "closed INTEGER NOT NULL, "
+                "amount REAL NOT NULL, "
+                "profit REAL NOT NULL, "
+                "data TEXT NOT NULL"
+                ")",
+            )
+            for column in self.INDEXED_COLUMNS:
+                connection.execute(f"CREATE INDEX IF NOT EXISTS deals_{column} ON deals ({column})")
+            self._connection = connection
+        return self._connection
+
+    def _close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    async def close(self) -> None:
+        """Close the database."""
+        await self._run(self._close)
+        self._executor.shutdown(wait=False)
+
+    @staticmethod
+    def _to_sql_value(value: typing.Any) -> typing.Any:
+        if isinstance(value, uuid.UUID):
+            return str(value)
+        if isinstance(value, datetime.datetime):
+            return value.timestamp()
+        if isinstance(value, enum.Enum):
+            return value.value
+        if isinstance(value, bool):
+            return int(value)
+        return value
+
+    @classmethod
+    def _to_row(cls, deal: Deal) -> tuple[typing.Any, ...]:
+        return (
+            *(cls._to_sql_value(getattr(deal, column)) for column in cls.COLUMNS),
+            deal.model_dump_json(by_alias=True),
+        )
+
+    def _write(self, rows: list[tuple[typing.Any, ...]]) -> None:
+        columns = (*self.COLUMNS, "data")
+        updates = ", ".join(f"{column} = excluded.{column}" for column in columns[1:])
+        connection = self._connect()
+        with connection:
+            connection.executemany(
+                f"INSERT INTO deals ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))}) "  # noqa: S608
+                f"ON CONFLICT (id) DO UPDATE SET {updates}",
+                rows,
+            )
+
+    def _select(self, query: str, params: list[typing.Any]) -> list[Deal]:
+        rows = self._connect().execute(query, params).fetchall()
+        return [Deal.model_validate_json(data) for (data,) in rows]
+
+    @classmethod
+    def _compile(cls, query: Q) -> tuple[str, list[typing.Any]] | None:
+        """
+        Translate query into SQL condition.
+
+        :return: Condition and parameters or None if the query cannot be translated.
+        :rtype: tuple[str, list[typing.Any]] | None
+        """
+        if query.op == "field":
+            return cls._compile_field(*query.args)
+        if query.op in {"and", "or", "not"}:
+            parts = [cls._compile(it) for it in query.args]
+            if any(part is None for part in parts):
+                return None
+            params = [param for part in parts for param in part[1]]  # type: ignore
+            if query.op == "not":
+                # comparisons with NULL are unknown in SQL but false in Python
+                return f"NOT COALESCE(({parts[0][0]}), 0)", params  # type: ignore
+            return f"({parts[0][0]} {query.op.upper()} {parts[1][0]})", params  # type: ignore
+        return None
+
+    @classmethod
+    def _compile_field(  # noqa: PLR0911
+        cls,
+        name: str,
+        op: str,
+        value: typing.Any,
+    ) -> tuple[str, list[typing.Any]] | None:
+        if name not in cls.COLUMNS or op not in _SQL_LOOKUPS:
+            return None
+        match op:
+            case "isnull":
+                return f"{name} IS {'' if value else 'NOT '}NULL", []
+            case "ne":
+                return f"{name} IS NOT ?", [cls._to_sql_value(value)]
+            case "in":
+                return cls._compile_in(name, value)
+            case "between":
+                low, high = map(cls._to_sql_value, value)
+                if low is None or high is None:
+                    return "0", []
+                return f"{name} BETWEEN ? AND ?", [low, high]
+            case "startswith":
+                return cls._compile_startswith(name, value)
+        value = cls._to_sql_value(value)
+        if value is None:
+            return (f"{name} IS NULL" if op == "eq" else "0"), []
+        return f"{name} {_SQL_OPERATORS[op]} ?", [value]
+
+    @classmethod
+    def _compile_in(cls, name: str, values: collections.abc.Iterable[typing.Any]) -> tuple[str, list[typing.Any]]:
+        params = [cls._to_sql_value(it) for it in values]
+        has_null = None in params
+        params = [it for it in params if it is not None]
+        condition = f"{name} IN ({', '.join('?' * len(params))})" if params else "0"
+        if has_null:
+            condition = f"({condition} OR {name} IS NULL)"
+        return condition, params
+
+    @classmethod
+    def _compile_startswith(cls, name: str, prefix: str) -> tuple[str, list[typing.Any]] | None:
+        if name not in cls.STRING_COLUMNS:
+            return None
+        if not prefix:
+            return f"{name} IS NOT NULL", []
+        if ord(prefix[-1]) < 0xD7FF:  # noqa: PLR2004
+            # prefix range, answered by the column index
+            return f"({name} >= ? AND {name} < ?)", [prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)]
+        return f"substr({name}, 1, ?) = ?", [len(prefix), prefix]
+
+    async def add_or_update_deal(self, deal: Deal) -> None:
+        await self.add_or_update_deal_bulk([deal])
+
+    async def add_or_update_deal_bulk(self, deals: list[Deal]) -> None:
+        if deals:
+            await self._run(self._write, [self._to_row(deal) for deal in deals])
+
+    async def get_deal(self, *, deal_id: uuid.UUID | None = None, request_id: int | None = None) -> Deal | None:
+        if deal_id:
+            deals = await self._run(self._select, "SELECT data FROM deals WHERE id = ?", [str(deal_id)])
+            if deals:
+                return deals[0]
+        if request_id:
+            deals = await self._run(
+                self._select,
+                "SELECT data FROM deals WHERE request_id = ? ORDER BY open_time DESC LIMIT 1",
+                [request_id],
+            )
+            if deals:
+                return deals[0]
+        return None
+
+    async def get_deals(
+        self,
+        *,
+        query: Q | None = None,
+        count: int | None = None,
+    ) -> collections.abc.Iterable[Deal]:
+        """
+        Query stored deals using Q expressions.
+
+        :param query: Deal filter expression
+        :type query: Q | None
+
+        :param count: Maximum number of latest returned deals
+        :type count: int | None
+
+        :return: Iterable of deals ordered by open time
+        :rtype: collections.abc.Iterable[Deal]
+        """
+        conditions: list[str] = []
+        params: list[typing.Any] = []
+        residual: list[Q] = []
+        for part in query.conjuncts() if query else []:
+            compiled = self._compile(part)
+            if compiled is None:
+                residual.append(part)
+            else:
+                conditions.append(compiled[0])
+                params.extend(compiled[1])
+
+        sql = "SELECT data FROM deals"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY open_time DESC"
+        if count and not residual:
+            sql += " LIMIT ?"
+            params.append(count)
+
+        deals: collections.abc.Iterable[Deal] = await self._run(self._select, sql, params)
+        if residual:
+            deals = (deal for deal in deals if all(part(deal) for part in residual))
+            if count:
+                deals = itertools.islice(deals, count)
+        result = list(deals)
+        result.reverse()
+        return result
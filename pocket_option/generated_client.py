@@ -9,7 +9,7 @@
 
 import typing
 
-from pocket_option import models
+from pocket_option import models, ticks
 from pocket_option.client import BasePocketOptionClient
 
 if typing.TYPE_CHECKING:
@@ -265,6 +265,32 @@ class PocketOptionClientOn:
     def __init__(self, client: BasePocketOptionClient) -> None:
         self.client = client
 
+    @typing.overload
+    def activity_changed(
+        self,
+        handler: None = None,
+    ) -> "typing.Callable[[TypedEventListener[models.ActivityChangedEvent]], None]": ...
+
+    @typing.overload
+    def activity_changed(
+        self,
+        handler: "TypedEventListener[models.ActivityChangedEvent]",
+    ) -> None: ...
+
+    def activity_changed(
+        self,
+        handler: "TypedEventListener[models.ActivityChangedEvent] | None" = None,
+    ) -> "None | typing.Callable[[TypedEventListener[models.ActivityChangedEvent]], None]":
+        """Triggered by assets storage when a known asset becomes available or unavailable for trading.
+
+        Category: `assets`
+
+
+        :param handler: Callback
+        :type handler: TypedEventListener[models.ActivityChangedEvent] | None
+        """
+        return self.client.add_on("activityChanged", handler=handler, model=models.ActivityChangedEvent)
+
     @typing.overload
     def assets_update(
         self,
@@ -317,22 +343,70 @@ class PocketOptionClientOn:
         """
         return self.client.add_on("chafor", handler=handler, model=models.MarketSentimentItemListTypeAdapter)
 
+    @typing.overload
+    def payout_changed(
+        self,
+        handler: None = None,
+    ) -> "typing.Callable[[TypedEventListener[models.PayoutChangedEvent]], None]": ...
+
+    @typing.overload
+    def payout_changed(
+        self,
+        handler: "TypedEventListener[models.PayoutChangedEvent]",
+    ) -> None: ...
+
+    def payout_changed(
+        self,
+        handler: "TypedEventListener[models.PayoutChangedEvent] | None" = None,
+    ) -> "None | typing.Callable[[TypedEventListener[models.PayoutChangedEvent]], None]":
+        """Triggered by assets storage when payout of a known asset changes.
+
+        Category: `assets`
+
+
+        :param handler: Callback
+        :type handler: TypedEventListener[models.PayoutChangedEvent] | None
+        """
+        return self.client.add_on("payoutChanged", handler=handler, model=models.PayoutChangedEvent)
+
     @typing.overload
     def update_close_value(
         self,
         handler: None = None,
+        *,
+        batch: typing.Literal[False] = False,
     ) -> "typing.Callable[[TypedEventListener[list[models.UpdateCloseValueItem]]], None]": ...
 
     @typing.overload
     def update_close_value(
         self,
         handler: "TypedEventListener[list[models.UpdateCloseValueItem]]",
+        *,
+        batch: typing.Literal[False] = False,
     ) -> None: ...
 
+    @typing.overload
     def update_close_value(
         self,
-        handler: "TypedEventListener[list[models.UpdateCloseValueItem]] | None" = None,
-    ) -> "None | typing.Callable[[TypedEventListener[list[models.UpdateCloseValueItem]]], None]":
+        handler: None = None,
+        *,
+        batch: typing.Literal[True],
+    ) -> "typing.Callable[[TypedEventListener[ticks.TickBatch]], None]": ...
+
+    @typing.overload
+    def update_close_value(
+        self,
+        handler: "TypedEventListener[ticks.TickBatch]",
+        *,
+        batch: typing.Literal[True],
+    ) -> None: ...
+
+    def update_close_value(
+        self,
+        handler: "typing.Callable[..., typing.Any] | None" = None,
+        *,
+        batch: bool = False,
+    ) -> "None | typing.Callable[[typing.Callable[..., typing.Any]], None]":
         """Triggered when real-time price stream values are updated.
 
         Category: `assets`
@@ -340,8 +414,14 @@ class PocketOptionClientOn:
 
         :param handler: Callback
         :type handler: TypedEventListener[list[models.UpdateCloseValueItem]] | None
-        """
-        return self.client.add_on("updateStream", handler=handler, model=models.UpdateCloseValueListTypeAdapter)
+        :param batch: Deliver `ticks.TickBatch` to the handler instead
+        :type batch: bool
+        """
+        return self.client.add_on(
+            "updateStream",
+            handler=handler,
+            model=ticks.TICK_BATCH_DECODER if batch else ticks.UPDATE_STREAM_DECODER,
+        )
 
     @typing.overload
     def update_history_new_fast(
@@ -4,7 +4,7 @@ import contextlib
 import typing
 
 from pocket_option.middleware import Middleware
-from pocket_option.utils import fix_timestamp, get_json_function
+from pocket_option.utils import get_json_function
 
 if typing.TYPE_CHECKING:
     from pocket_option.types import JsonValue
@@ -15,29 +15,6 @@ __all__ = (
 )
 
 
-UPDATE_ITEMS_NAMES = [
-    "id",
-    "asset",
-    "label",
-    "type",
-    "digits",
-    "payout",
-    "default_expiration",
-    "min_expiration",
-    "expiration_step",
-    "is_otc",
-    "otc_id",
-    "real_id",
-    "signals",
-    "exp_time",
-    "active",
-    "timeframes",
-    "scheduled_until",
-    "min_quick_timeframe",
-    "scheduled_at",
-]
-
-
 class MakeJsonOnMiddleware(Middleware):
     def __init__(self) -> None:
         self.json = get_json_function()
@@ -53,17 +30,6 @@ class FixTypesOnMiddleware(Middleware):
     async def on(self, event: str, data: JsonValue | None) -> JsonValue | None:  # type: ignore
         if data is None:
             return None
-        if event == "updateStream":
-            return [
-                {
-                    "asset": it[0],
-                    "timestamp": fix_timestamp(it[1]),
-                    "value": it[2],
-                }
-                for it in typing.cast("list[tuple[str, float, float]]", data)
-            ]
-        if event == "updateAssets":
-            return [dict(zip(UPDATE_ITEMS_NAMES, it, strict=True)) for it in typing.cast("list[list]", data)]
         if event == "chafor":
             return [dict(zip(["asset", "value"], it, strict=True)) for it in typing.cast("list[list]", data)]
 
@@ -1,11 +1,16 @@
 import datetime
 import enum
+import threading
 import typing
 import uuid
 
 import pydantic
 
+from pocket_option.constants import UPDATE_ITEMS_NAMES
+from pocket_option.utils import fix_timestamp
+
 __all__ = (
+    "ActivityChangedEvent",
     "Asset",
     "AssetItemTimeframe",
     "AssetType",
@@ -25,6 +30,7 @@ __all__ = (
     "OpenDealRequest",
     "OpenPendingDealRequest",
     "OpenPendingDealRequestOpenType",
+    "PayoutChangedEvent",
     "SuccessAuthEvent",
     "SuccessUpdateBalanceEvent",
     "UpdateAssetItem",
@@ -174,30 +180,39 @@ class Asset(enum.StrEnum):
     def is_otc(self) -> bool:
         return self.endswith("_otc")
 
-    def __new__(cls, value: str) -> typing.Self:
-        for member in cls:
-            if member.value == value:
-                return member
+    @classmethod
+    def resolve(cls, value: str) -> typing.Self:
+        """
+        Resolve asset by value.
 
-        obj = str.__new__(cls, value)
-        obj._name_ = value
-        obj._value_ = value
-        return obj
+        Uses interned lookup table, so resolution is a single dict lookup.
+        Unknown values are registered dynamically (see :meth:`_missing_`).
+        """
+        member = _ASSET_LOOKUP.get(value)
+        if member is None:
+            return cls._missing_(value)
+        return member  # type: ignore
 
     @classmethod
     def _missing_(cls, value: str) -> typing.Self:  # type: ignore
         """
         Create a new Asset instance for unknown values dynamically.
         Does NOT modify class attributes (avoids AttributeError).
-        """
-        obj = str.__new__(cls, value)
-        obj._name_ = value
-        obj._value_ = value
 
-        # Register in value map so that repeated calls return the same object
-        cls._value2member_map_[value] = obj
-
-        return obj
+        Registration is guarded by a lock, so concurrent calls with
+        the same value always return the same object.
+        """
+        with _ASSET_LOOKUP_LOCK:
+            if (member := _ASSET_LOOKUP.get(value)) is not None:
+                return member  # type: ignore
+            obj = str.__new__(cls, value)
+            obj._name_ = value
+            obj._value_ = value
+
+            # Register in value map so that repeated calls return the same object
+            cls._value2member_map_[value] = obj
+            _ASSET_LOOKUP[value] = obj
+            return obj
 
     @classmethod
     def __get_validators__(cls):  # noqa: ANN206
@@ -208,14 +223,18 @@ class Asset(enum.StrEnum):
         if isinstance(value, cls):
             return value
         if isinstance(value, str):
-            return cls(value)
+            return cls.resolve(value)
         raise TypeError(f"Invalid type for Asset: {type(value)}")
 
     @classmethod
     def __get_pydantic_core_schema__(cls, _source_type, _handler):  # noqa: ANN001, ANN206
         from pydantic_core import core_schema  # noqa: F811, PLC0415, RUF100
 
-        return core_schema.no_info_after_validator_function(cls, core_schema.str_schema())
+        return core_schema.no_info_after_validator_function(cls.resolve, core_schema.str_schema())
+
+
+_ASSET_LOOKUP: dict[str, Asset] = {member.value: member for member in Asset}
+_ASSET_LOOKUP_LOCK = threading.Lock()
 
 
 class AuthorizationData(BaseRequest):
@@ -311,6 +330,9 @@ class UpdateCloseValueItem(BaseEvent):
     This model is used for real-time price stream updates and contains
     the asset identifier, event timestamp and current price value.
 
+    Also accepts raw ``[asset, timestamp, value]`` rows as sent by
+    the server; timestamps of raw rows are fixed with ``fix_timestamp``.
+
     :ivar asset: Trading asset associated with the update.
     :ivar timestamp: Unix timestamp of the price update.
     :ivar value: Current asset price value.
@@ -320,6 +342,14 @@ class UpdateCloseValueItem(BaseEvent):
     timestamp: float
     value: float
 
+    @pydantic.model_validator(mode="before")
+    @classmethod
+    def _from_row(cls, data: typing.Any) -> typing.Any:
+        if isinstance(data, list | tuple):
+            asset, timestamp, value = data
+            return {"asset": asset, "timestamp": fix_timestamp(timestamp), "value": value}
+        return data
+
 
 UpdateCloseValueListTypeAdapter = pydantic.TypeAdapter(list[UpdateCloseValueItem])
 
@@ -628,6 +658,8 @@ class UpdateAssetItem(BaseEvent):
     :ivar scheduled_until: Timestamp until which the asset schedule is valid.
     :ivar min_quick_timeframe: Minimum timeframe available for quick trades.
     :ivar scheduled_at: Timestamp when the asset schedule was created.
+
+    Also accepts raw rows as sent by the server, fields in the order above.
     """
 
     id: int
@@ -657,10 +689,47 @@ class UpdateAssetItem(BaseEvent):
     min_quick_timeframe: int
     scheduled_at: int
 
+    @pydantic.model_validator(mode="before")
+    @classmethod
+    def _from_row(cls, data: typing.Any) -> typing.Any:
+        if isinstance(data, list | tuple):
+            return dict(zip(UPDATE_ITEMS_NAMES, data, strict=True))
+        return data
+
 
 UpdateAssetItemListTypeAdapter = pydantic.TypeAdapter(list[UpdateAssetItem])
 
 
+class PayoutChangedEvent(BaseEvent):
+    """
+    Local event emitted by assets storage when payout of a known asset changes.
+
+    :ivar id: Asset identifier.
+    :ivar asset: Asset symbol identifier.
+    :ivar old_payout: Previous payout percentage.
+    :ivar payout: Current payout percentage.
+    """
+
+    id: int
+    asset: Asset
+    old_payout: int
+    payout: int
+
+
+class ActivityChangedEvent(BaseEvent):
+    """
+    Local event emitted by assets storage when a known asset becomes available or unavailable for trading.
+
+    :ivar id: Asset identifier.
+    :ivar asset: Asset symbol identifier.
+    :ivar active: Whether the asset is currently available for trading.
+    """
+
+    id: int
+    asset: Asset
+    active: bool
+
+
 class MarketSentimentItem(BaseEvent):
     """
     Market sentiment data model.
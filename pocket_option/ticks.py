@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+import os
+import typing
+from array import array
+from itertools import compress
+
+from pocket_option.constants import TIMESTAMP_OFFSET
+from pocket_option.models import Asset, UpdateCloseValueItem, UpdateCloseValueListTypeAdapter
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+    from pocket_option.utils import Q
+
+__all__ = (
+    "TICK_BATCH_DECODER",
+    "UPDATE_STREAM_DECODER",
+    "Tick",
+    "TickBatch",
+    "TickBatchDecoder",
+    "UpdateStreamDecoder",
+    "decode_ticks",
+)
+
+
+class Tick(typing.NamedTuple):
+    """
+    Compact price update.
+
+    Lightweight alternative to :class:`~pocket_option.models.UpdateCloseValueItem`
+    used on the hot ``updateStream`` path.
+
+    :ivar asset: Trading asset associated with the update.
+    :ivar timestamp: Unix timestamp of the price update.
+    :ivar value: Current asset price value.
+    """
+
+    asset: Asset
+    timestamp: float
+    value: float
+
+
+def decode_ticks(data: list[list[typing.Any]]) -> list[Tick]:
+    """
+    Decode raw ``updateStream`` frame.
+
+    The frame is a list of ``[asset, timestamp, value]`` rows. Assets are
+    resolved through the interned lookup table and timestamps are shifted
+    by :data:`~pocket_option.constants.TIMESTAMP_OFFSET`. No validation
+    is performed.
+
+    :param data: Raw frame payload.
+    :type data: list[list[typing.Any]]
+
+    :return: Decoded price updates.
+    :rtype: list[Tick]
+    """
+    resolve = Asset.resolve
+    return [Tick(resolve(asset), float(timestamp) + TIMESTAMP_OFFSET, float(value)) for asset, timestamp, value in data]
+
+
+class TickBatch:
+    """
+    Columnar batch of price updates.
+
+    Iterating over the batch yields :class:`~pocket_option.models.UpdateCloseValueItem`
+    models created on demand, so handlers written for
+    ``list[UpdateCloseValueItem]`` keep working. Hot consumers should read
+    the columns or :meth:`by_asset` instead.
+
+    :ivar assets: Asset of every update.
+    :ivar timestamps: Unix timestamp of every update.
+    :ivar values: Price value of every update.
+    """
+
+    __slots__ = ("_groups", "assets", "timestamps", "values")
+
+    def __init__(
+        self,
+        assets: list[Asset] | None = None,
+        timestamps: array[float] | None = None,
+        values: array[float] | None = None,
+    ) -> None:
+        self.assets = assets if assets is not None else []
+        self.timestamps = timestamps if timestamps is not None else array("d")
+        self.values = values if values is not None else array("d")
+        self._groups: dict[Asset, TickBatch] | None = None
+
+    @classmethod
+    def from_ticks(cls, ticks: typing.Iterable[Tick]) -> typing.Self:
+        """
+        Build batch from ticks or models.
+
+        :param ticks: Items with ``asset``, ``timestamp`` and ``value`` attributes.
+        :type ticks: typing.Iterable[Tick]
+
+        :return: New batch.
+        :rtype: TickBatch
+        """
+        batch = cls()
+        for tick in ticks:
+            batch.append(tick.asset, tick.timestamp, tick.value)
+        return batch
+
+    def append(self, asset: Asset, timestamp: float, value: float) -> None:
+        self.assets.append(asset)
+        self.timestamps.append(timestamp)
+        self.values.append(value)
+        self._groups = None
+
+    def __len__(self) -> int:
+        return len(self.assets)
+
+    def __bool__(self) -> bool:
+        return bool(self.assets)
+
+    def __iter__(self) -> Iterator[UpdateCloseValueItem]:
+        for index in range(len(self.assets)):
+            yield self[index]
+
+    def __getitem__(self, index: int) -> UpdateCloseValueItem:
+        return UpdateCloseValueItem.model_construct(
+            asset=self.assets[index],
+            timestamp=self.timestamps[index],
+            value=self.values[index],
+        )
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(len={len(self)})"
+
+    def ticks(self) -> Iterator[Tick]:
+        """
+        Iterate over the batch without creating models.
+
+        :return: Iterator of ticks.
+        :rtype: Iterator[Tick]
+        """
+        return map(Tick, self.assets, self.timestamps, self.values)
+
+    def to_items(self) -> list[UpdateCloseValueItem]:
+        """
+        Materialize every row as a model.
+
+        :return: Models in batch order.
+        :rtype: list[UpdateCloseValueItem]
+        """
+        return list(self)
+
+    def columns(self) -> dict[str, Sequence[typing.Any]]:
+        """
+        Get columns keyed by :class:`Tick` field names.
+
+        :return: Column per field name.
+        :rtype: dict[str, Sequence[typing.Any]]
+        """
+        return {"asset": self.assets, "timestamp": self.timestamps, "value": self.values}
+
+    def filter(self, query: Q) -> TickBatch:
+        """
+        Select updates matching query.
+
+        The query is evaluated over the columns in one pass
+        (see :meth:`~pocket_option.utils.Q.mask`), no models are created.
+
+        Example:
+
+            batch = batch.filter(Q.field("asset", "eq", Asset.AUDCAD_otc) & Q.field("value", "gt", 0.9))
+
+        :param query: Tick filter expression.
+        :type query: Q
+
+        :return: Matching updates in batch order.
+        :rtype: TickBatch
+        """
+        mask = query.mask(self.columns())
+        return TickBatch(
+            list(compress(self.assets, mask)),
+            array("d", compress(self.timestamps, mask)),
+            array("d", compress(self.values, mask)),
+        )
+
+    def by_asset(self) -> dict[Asset, TickBatch]:
+        """
+        Group updates by asset.
+
+        The grouping is computed once and cached until the batch changes.
+        Order of updates within every group is preserved.
+
+        :return: Batch per asset.
+        :rtype: dict[Asset, TickBatch]
+        """
+        if self._groups is None:
+            groups: dict[Asset, TickBatch] = {}
+            for asset, timestamp, value in zip(self.assets, self.timestamps, self.values, strict=True):
+                group = groups.get(asset)
+                if group is None:
+                    group = groups[asset] = TickBatch()
+                group.assets.append(asset)
+                group.timestamps.append(timestamp)
+                group.values.append(value)
+            self._groups = groups
+        return self._groups
+
+
+class _StreamDecoder:
+    """
+    Base of ``updateStream`` decoders.
+
+    Decoders can be passed as ``model`` to
+    :meth:`~pocket_option.client.BasePocketOptionClient.add_on`.
+
+    :ivar validate:
+        Validate frames with pydantic before decoding.
+        Slow, intended for debugging. Enabled by ``PO_DEBUG=1``.
+    """
+
+    __slots__ = ("validate",)
+
+    def __init__(self, *, validate: bool | None = None) -> None:
+        self.validate = os.environ.get("PO_DEBUG") == "1" if validate is None else validate
+
+
+class UpdateStreamDecoder(_StreamDecoder):
+    """
+    ``updateStream`` decoder producing :class:`~pocket_option.models.UpdateCloseValueItem` models.
+
+    Models are constructed from decoded ticks without pydantic validation
+    unless ``validate`` is enabled.
+    """
+
+    __slots__ = ()
+
+    def validate_python(self, data: list[list[typing.Any]]) -> list[UpdateCloseValueItem]:
+        if self.validate:
+            return UpdateCloseValueListTypeAdapter.validate_python(data)
+        construct = UpdateCloseValueItem.model_construct
+        return [
+            construct(asset=asset, timestamp=timestamp, value=value) for asset, timestamp, value in decode_ticks(data)
+        ]
+
+
+class TickBatchDecoder(_StreamDecoder):
+    """
+    ``updateStream`` decoder producing :class:`TickBatch`.
+    """
+
+    __slots__ = ()
+
+    def validate_python(self, data: list[list[typing.Any]]) -> TickBatch:
+        if self.validate:
+            return TickBatch.from_ticks(UpdateCloseValueListTypeAdapter.validate_python(data))
+        resolve = Asset.resolve
+        assets = []
+        timestamps = array("d")
+        values = array("d")
+        for asset, timestamp, value in data:
+            assets.append(resolve(asset))
+            timestamps.append(timestamp + TIMESTAMP_OFFSET)
+            values.append(value)
+        return TickBatch(assets, timestamps, values)
+
+
+TICK_BATCH_DECODER = TickBatchDecoder()
+UPDATE_STREAM_DECODER = UpdateStreamDecoder()
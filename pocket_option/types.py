@@ -3,7 +3,7 @@ from __future__ import annotations
 import collections.abc
 import typing
 
-__all__ = ("EmitCallback", "JsonFunction", "JsonValue", "SIOEventListener", "TypedEventListener")
+__all__ = ("EmitCallback", "EventDecoder", "JsonFunction", "JsonValue", "SIOEventListener", "TypedEventListener")
 
 
 type JsonValue = int | float | str | "dict[str, JsonValue]" | "list[JsonValue]"
@@ -14,6 +14,10 @@ class JsonFunction(typing.Protocol):
     def loads(self, value: str | bytes) -> JsonValue: ...
 
 
+class EventDecoder(typing.Protocol):
+    def validate_python(self, data: typing.Any, /) -> typing.Any: ...
+
+
 type EmitCallback[T] = (
     collections.abc.Callable[
         [str, int, T],
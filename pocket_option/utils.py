@@ -1,26 +1,88 @@
 from __future__ import annotations
 
+import asyncio
 import contextlib
+import dataclasses
 import datetime
 import inspect
+import keyword
+import operator
+import os
 import random
+import threading
 import time
+import types
 import typing
 from dataclasses import dataclass
 
 from pocket_option.constants import TIMESTAMP_OFFSET
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 if typing.TYPE_CHECKING:
+    import collections.abc
+    import pathlib
     from collections import deque
     from collections.abc import Callable
 
     from pocket_option.types import JsonFunction, JsonValue
 
-__all__ = ("Q", "append_or_replace", "fix_timestamp", "generate_index", "generate_request_id", "get_json_function")
+__all__ = (
+    "Q",
+    "QueryPlan",
+    "SnapshotWriter",
+    "append_or_replace",
+    "fix_timestamp",
+    "generate_index",
+    "generate_request_id",
+    "get_json_function",
+)
 
 rnd = random.SystemRandom()
 
 
+def _timestamp(value: typing.Any) -> typing.Any:
+    if isinstance(value, datetime.datetime):
+        return value.timestamp()
+    return value
+
+
+_COMPARISONS = {"eq": "==", "ne": "!=", "gt": ">", "gte": ">=", "lt": "<", "lte": "<="}
+_OPERATORS = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "gt": operator.gt,
+    "gte": operator.ge,
+    "lt": operator.lt,
+    "lte": operator.le,
+}
+_LOOKUPS = frozenset({*_COMPARISONS, "in", "between", "startswith", "isnull"})
+
+
+def _is_number(value: typing.Any) -> bool:
+    return isinstance(value, int | float) and not isinstance(value, bool)
+
+
+def _row(names: tuple[str, ...], values: tuple[typing.Any, ...]) -> types.SimpleNamespace:
+    return types.SimpleNamespace(**dict(zip(names, values, strict=True)))
+
+
+@dataclass(slots=True, frozen=True)
+class QueryPlan:
+    """
+    Query split for index pushdown.
+
+    :ivar lookups: Top-level ``&`` field lookups ``(name, op, value)`` the storage can answer from its indexes.
+    :ivar residual: Remaining expression to evaluate per object, or None.
+    """
+
+    lookups: tuple[tuple[str, str, typing.Any], ...]
+    residual: Q | None
+
+
 @dataclass(slots=True)
 class Q:
     """
@@ -58,6 +120,9 @@ class Q:
         - ``eq``:
             Field equals value.
 
+        - ``ne``:
+            Field does not equal value.
+
         - ``gt``:
             Field greater than value.
 
@@ -70,27 +135,176 @@ class Q:
         - ``lte``:
             Field less than or equal to value.
 
+        - ``in``:
+            Field equals any of the values (one hash probe).
+
+        - ``between``:
+            Field is within ``(low, high)``, both ends included.
+
+        - ``startswith``:
+            Field is a string starting with value.
+
         - ``isnull``:
             Checks whether field value is None.
 
-    DateTime fields are automatically converted to Unix timestamps
-    before comparison.
+    DateTime fields and values are automatically converted to Unix
+    timestamps before comparison.
+
+    Every Q keeps the expression it was built from, so storages can
+    translate it (e.g. into SQL) or answer parts of it from indexes
+    (see :meth:`plan`):
+
+        - ``op == "field"``: ``args`` is ``(name, lookup, value)``;
+        - ``op in ("and", "or")``: ``args`` is ``(left, right)``;
+        - ``op == "not"``: ``args`` is ``(query,)``;
+        - ``op == "func"``: opaque predicate ``func``.
 
+    On first evaluation the whole expression is compiled into a single
+    flat predicate, so nested expressions cost no extra calls per object.
+    Column-oriented data is filtered with :meth:`mask` in one pass.
     """
 
-    func: Callable[[typing.Any], bool]
+    func: Callable[[typing.Any], bool] | None = None
+    op: str = "func"
+    args: tuple[typing.Any, ...] = ()
+    _predicate: Callable[[typing.Any], bool] | None = dataclasses.field(
+        default=None,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _masks: dict[tuple[str, ...], Callable[[typing.Any], list[bool]]] = dataclasses.field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+        compare=False,
+    )
 
     def __call__(self, obj: typing.Any) -> bool:
-        return self.func(obj)
+        return (self._predicate or self.compile())(obj)
 
     def __and__(self, other: Q) -> Q:
-        return Q(lambda obj: self(obj) and other(obj))
+        return Q(op="and", args=(self, other))
 
     def __or__(self, other: Q) -> Q:
-        return Q(lambda obj: self(obj) or other(obj))
+        return Q(op="or", args=(self, other))
 
     def __invert__(self) -> Q:
-        return Q(lambda obj: not self(obj))
+        return Q(op="not", args=(self,))
+
+    def compile(self) -> Callable[[typing.Any], bool]:
+        """
+        Compile expression into a single predicate.
+
+        Field lookups become inline attribute comparisons, ``&``/``|``/``~``
+        become ``and``/``or``/``not`` of one Python expression. The result
+        is cached.
+
+        :return: Predicate.
+        :rtype: Callable[[typing.Any], bool]
+        """
+        if self._predicate is None:
+            namespace: dict[str, typing.Any] = {"_timestamp": _timestamp}
+            source = _compile_source(self, namespace)
+            self._predicate = eval(f"lambda obj: {source}", namespace)  # noqa: S307
+        return self._predicate  # type: ignore
+
+    def mask(self, columns: collections.abc.Mapping[str, collections.abc.Sequence[typing.Any]]) -> typing.Any:
+        """
+        Evaluate expression against column-oriented data.
+
+        ``columns`` maps field names to equally sized columns; row ``i`` is
+        made of the ``i``-th item of every column. When any column is a
+        ``numpy.ndarray`` the expression is evaluated with array operations
+        and a boolean ``numpy.ndarray`` is returned. Otherwise the expression
+        is compiled into a single comprehension over the zipped columns
+        (cached per set of columns) and a ``list[bool]`` is returned.
+
+        Opaque predicates receive a namespace object with one attribute per
+        column.
+
+        Example:
+
+            mask = Q.field("close", "gt", 1.1).mask({"close": batch.close})
+
+        :param columns: Column per field name.
+        :type columns: collections.abc.Mapping[str, collections.abc.Sequence[typing.Any]]
+
+        :raises KeyError: If expression refers to a missing column.
+
+        :return: Boolean mask, one item per row.
+        :rtype: list[bool] | numpy.ndarray
+        """
+        if np is not None and any(isinstance(it, np.ndarray) for it in columns.values()):
+            return _numpy_mask(self, columns)
+        names = tuple(columns)
+        function = self._masks.get(names)
+        if function is None:
+            namespace: dict[str, typing.Any] = {"_timestamp": _timestamp, "_row": _row, "_names": names}
+            source = _compile_source(self, namespace, names)
+            function = eval(  # noqa: S307
+                f"lambda columns: [{source} for row in zip(*columns.values(), strict=True)]",
+                namespace,
+            )
+            self._masks[names] = function
+        return function(columns)
+
+    def field_names(self) -> set[str] | None:
+        """
+        Get names of fields used by the expression.
+
+        :return: Field names, or None if the expression contains opaque predicates.
+        :rtype: set[str] | None
+        """
+        match self.op:
+            case "field":
+                return {self.args[0]}
+            case "and" | "or" | "not":
+                names: set[str] = set()
+                for part in self.args:
+                    part_names = part.field_names()
+                    if part_names is None:
+                        return None
+                    names |= part_names
+                return names
+        return None
+
+    def conjuncts(self) -> list[Q]:
+        """
+        Split top-level ``&`` expression into its parts.
+
+        :return: Expressions that all must match.
+        :rtype: list[Q]
+        """
+        if self.op == "and":
+            return [*self.args[0].conjuncts(), *self.args[1].conjuncts()]
+        return [self]
+
+    def plan(self, indexes: collections.abc.Mapping[str, collections.abc.Container[str]]) -> QueryPlan:
+        """
+        Split query into index lookups and a residual expression.
+
+        Top-level ``&`` parts that are field lookups supported by ``indexes``
+        are returned as lookups; all other parts form the residual.
+
+        Example:
+
+            plan = query.plan({"id": {"eq"}, "asset": {"eq"}})
+
+        :param indexes: Supported lookup operators per field.
+        :type indexes: collections.abc.Mapping[str, collections.abc.Container[str]]
+
+        :return: Query plan.
+        :rtype: QueryPlan
+        """
+        lookups = []
+        residual = None
+        for part in self.conjuncts():
+            if part.op == "field" and part.args[1] in indexes.get(part.args[0], ()):
+                lookups.append(part.args)
+            else:
+                residual = part if residual is None else residual & part
+        return QueryPlan(tuple(lookups), residual)
 
     @classmethod
     def field(
@@ -120,54 +334,262 @@ class Q:
         Supported operators:
 
             - eq
+            - ne
             - gt
             - gte
             - lt
             - lte
+            - in
+            - between
+            - startswith
             - isnull
 
+        Example:
+
+            query = Q.field("asset", "in", {Asset.AUDCAD_otc, Asset.EURUSD_otc}) & Q.field(
+                "open_time",
+                "between",
+                (since, until),
+            )
+
         :param name: Object attribute name.
         :type name: str
 
         :param op: Comparison operator.
         :type op: str
 
-        :param value: Value to compare against.
+        :param value:
+            Value to compare against. Iterable of values for ``in``,
+            ``(low, high)`` pair for ``between``, string for ``startswith``.
         :type value: typing.Any
 
-        :raises ValueError: If operator is not supported.
+        :raises ValueError:
+            If name is not an identifier or is a keyword, operator is not supported
+            or value does not fit the operator.
 
         :return: Query expression.
         :rtype: Q
         """
+        if not name.isidentifier() or keyword.iskeyword(name):
+            raise ValueError(name)
+        if op not in _LOOKUPS:
+            raise ValueError(op)
+        if op == "in":
+            if isinstance(value, str) or not hasattr(value, "__iter__"):
+                raise ValueError(value)
+            value = frozenset(map(_timestamp, value))
+        elif op == "between":
+            if len(value) != 2:  # noqa: PLR2004
+                raise ValueError(value)
+            value = (_timestamp(value[0]), _timestamp(value[1]))
+        elif op == "startswith" and not isinstance(value, str):
+            raise ValueError(value)
+        elif op in _COMPARISONS:
+            value = _timestamp(value)
+        return cls(op="field", args=(name, op, value))
+
+
+def _compile_source(
+    query: Q,
+    namespace: dict[str, typing.Any],
+    columns: tuple[str, ...] | None = None,
+) -> str:
+    def const(value: typing.Any) -> str:
+        name = f"_c{len(namespace)}"
+        namespace[name] = value
+        return name
+
+    def getter(name: str) -> str:
+        if columns is None:
+            return f"obj.{name}"
+        if name not in columns:
+            raise KeyError(name)
+        return f"row[{columns.index(name)}]"
+
+    match query.op:
+        case "field":
+            name, op, value = query.args
+            return _compile_lookup(getter(name), op, value, const)
+        case "and" | "or":
+            left, right = (_compile_source(it, namespace, columns) for it in query.args)
+            return f"({left} {query.op} {right})"
+        case "not":
+            return f"(not {_compile_source(query.args[0], namespace, columns)})"
+    if columns is None:
+        return f"{const(query.func)}(obj)"
+    return f"{const(query.func)}(_row(_names, row))"
+
+
+def _compile_lookup(source: str, op: str, value: typing.Any, const: Callable[[typing.Any], str]) -> str:
+    if op == "isnull":
+        return f"(({source} is None) == {const(value)})"
+    if op == "startswith":
+        return f"(isinstance({source}, str) and {source}.startswith({const(value)}))"
+    values = value if op in {"in", "between"} else (_timestamp(value),)
+    if any(map(_is_number, values)):
+        source = f"_timestamp({source})"
+    if op == "in":
+        return f"({source} in {const(value)})"
+    if op == "between":
+        return f"({const(value[0])} <= {source} <= {const(value[1])})"
+    return f"({source} {_COMPARISONS[op]} {const(values[0])})"
+
+
+def _numpy_mask(query: Q, columns: collections.abc.Mapping[str, collections.abc.Sequence[typing.Any]]) -> typing.Any:
+    match query.op:
+        case "field":
+            return _numpy_field_mask(np.asarray(columns[query.args[0]]), *query.args[1:])
+        case "and":
+            return _numpy_mask(query.args[0], columns) & _numpy_mask(query.args[1], columns)
+        case "or":
+            return _numpy_mask(query.args[0], columns) | _numpy_mask(query.args[1], columns)
+        case "not":
+            return ~_numpy_mask(query.args[0], columns)
+    names = tuple(columns)
+    rows = zip(*columns.values(), strict=True)
+    return np.fromiter((bool(query.func(_row(names, row))) for row in rows), dtype=bool)  # type: ignore
+
+
+def _numpy_field_mask(column: typing.Any, op: str, value: typing.Any) -> typing.Any:  # noqa: PLR0911
+    size = len(column)
+    if op == "isnull":
+        if column.dtype == object:
+            isnull = np.fromiter((it is None for it in column), dtype=bool, count=size)
+        else:
+            isnull = np.zeros(size, dtype=bool)
+        return isnull if value else ~isnull
+    if op == "startswith":
+        if column.dtype.kind == "U":
+            return np.char.startswith(column, value)
+        return np.fromiter((isinstance(it, str) and it.startswith(value) for it in column), dtype=bool, count=size)
+
+    if op == "in":
+        if column.dtype == object:
+            return np.fromiter((_timestamp(it) in value for it in column), dtype=bool, count=size)
+        return np.isin(column, list(value))
+
+    values = value if op == "between" else (_timestamp(value),)
+    if column.dtype == object and any(map(_is_number, values)):
+        column = np.fromiter(map(_timestamp, column), dtype=float, count=size)
+    if op == "between":
+        return (column >= values[0]) & (column <= values[1])
+    result = np.asarray(_OPERATORS[op](column, values[0]), dtype=bool)
+    return result if result.shape == column.shape else np.full(column.shape, result)
+
+
+class SnapshotWriter[T]:
+    """
+    Debounced snapshot persistence.
 
-        def getter(obj: typing.Any):
-            result = getattr(obj, name)
-            if isinstance(result, datetime.datetime):
-                return result.timestamp()
-            return result
-
-        match op:
-            case "eq":
-                return cls(lambda obj: getter(obj) == value)
-
-            case "gt":
-                return cls(lambda obj: getter(obj) > value)
-
-            case "gte":
-                return cls(lambda obj: getter(obj) >= value)
+    Storages call :meth:`mark_dirty` after every change. The first change
+    starts a timer of ``delay`` seconds; all changes made until it fires
+    are coalesced into a single snapshot.
 
-            case "lt":
-                return cls(lambda obj: getter(obj) < value)
+    A snapshot is taken on the event loop thread with ``snapshot`` (it
+    should only copy the data), then ``serialize`` runs in a worker thread
+    and the result is written atomically: into a temporary file that
+    replaces ``path`` with :func:`os.replace`. Writes are serialized, so
+    :meth:`write` waits for a flush in progress, and a snapshot never
+    replaces a newer one.
 
-            case "lte":
-                return cls(lambda obj: getter(obj) <= value)
+    Example:
 
-            case "isnull":
-                return cls(lambda obj: (getter(obj) is None) == value)
+        writer = SnapshotWriter(
+            path,
+            snapshot=lambda: dict(storage),
+            serialize=adapter.dump_json,
+        )
+        writer.mark_dirty()
+        ...
+        await writer.flush()
+    """
 
-            case _:
-                raise ValueError(op)
+    __slots__ = (
+        "_dirty",
+        "_generation",
+        "_handle",
+        "_lock",
+        "_tasks",
+        "_write_lock",
+        "_written",
+        "delay",
+        "path",
+        "serialize",
+        "snapshot",
+    )
+
+    def __init__(
+        self,
+        path: pathlib.Path,
+        *,
+        snapshot: Callable[[], T],
+        serialize: Callable[[T], bytes],
+        delay: float = 1.0,
+    ) -> None:
+        self.path = path
+        self.snapshot = snapshot
+        self.serialize = serialize
+        self.delay = delay
+        self._dirty = False
+        self._handle: asyncio.TimerHandle | None = None
+        self._lock = asyncio.Lock()
+        self._tasks: set[asyncio.Task[None]] = set()
+        # snapshots are numbered on the event loop thread, written in worker threads
+        self._write_lock = threading.Lock()
+        self._generation = 0
+        self._written = 0
+
+    @property
+    def dirty(self) -> bool:
+        return self._dirty
+
+    def mark_dirty(self) -> None:
+        """Schedule snapshot after a change."""
+        self._dirty = True
+        if self._handle is None:
+            self._handle = asyncio.get_running_loop().call_later(self.delay, self._on_timer)
+
+    def _on_timer(self) -> None:
+        self._handle = None
+        task = asyncio.create_task(self.flush())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _take_snapshot(self) -> tuple[int, T]:
+        self._dirty = False
+        self._generation += 1
+        return self._generation, self.snapshot()
+
+    def _write(self, generation: int, data: T) -> None:
+        payload = self.serialize(data)
+        with self._write_lock:
+            if generation < self._written:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(self.path.name + ".tmp")
+            with tmp.open("wb") as file:
+                file.write(payload)
+                file.flush()
+                os.fsync(file.fileno())
+            tmp.replace(self.path)
+            self._written = generation
+
+    def write(self) -> None:
+        """Write snapshot immediately in the current thread."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        self._write(*self._take_snapshot())
+
+    async def flush(self) -> None:
+        """Write pending snapshot without blocking the event loop."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        async with self._lock:
+            if not self._dirty:
+                return
+            await asyncio.to_thread(self._write, *self._take_snapshot())
 
 
 def get_function_full_name(fn: typing.Callable) -> str:
@@ -0,0 +1,21 @@
+import timeit
+
+from pocket_option.models import Asset, UpdateCloseValueListTypeAdapter
+from pocket_option.utils import fix_timestamp
+
+ASSETS = [it.value for it in Asset]
+FRAME_SIZE = 1000
+NUMBER = 200
+
+frame = [[ASSETS[i % len(ASSETS)], 1_700_000_000 + i / 10, 1.1 + i / 1000] for i in range(FRAME_SIZE)]
+items = [{"asset": it[0], "timestamp": fix_timestamp(it[1]), "value": it[2]} for it in frame]
+
+
+def bench(name: str, func) -> None:
+    seconds = timeit.timeit(func, number=NUMBER)
+    print(f"{name:<32} {int(FRAME_SIZE * NUMBER / seconds):>12,} ticks/sec")
+
+
+bench("Asset(value)", lambda: [Asset(it[0]) for it in frame])
+bench("Asset.resolve(value)", lambda: [Asset.resolve(it[0]) for it in frame])
+bench("UpdateCloseValueListTypeAdapter", lambda: UpdateCloseValueListTypeAdapter.validate_python(items))